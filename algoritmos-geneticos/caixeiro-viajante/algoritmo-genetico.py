@@ -0,0 +1,272 @@
+import os
+import sys
+import time
+from typing import Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from comum.perfil import PERFIL
+from comum.selecao import torneio, selecionar_sobreviventes
+from comum.tsp import (carregar_tsplib, salvar_tsplib, gerar_cidades_aleatorias, matriz_distancias,
+                       listas_candidatos, comprimentos_rotas, plotar_rota)
+
+N_POPULACAO = 100
+N_GERACOES = 1000
+P_MUTACAO = 0.2
+TAMANHO_TORNEIO = 3
+CROSSOVER = "guloso" # "ox", "pmx" ou "guloso"
+NUM_CANDIDATOS = 10 # vizinhos considerados pelo crossover "guloso"
+GEN_IMPRIMIR = 50
+# mesma instância usada pelo Ant System, para comparar os dois algoritmos
+NOME_ARQUIVO = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'ant-system', 'caixeiro-viajante', 'cidades_100.tsp')
+NUM_CIDADES_GERACAO = 100
+
+def main():
+    carregar_configuracao = input("Deseja carregar uma configuração existente? (S/N): ").lower() == "s"
+
+    if carregar_configuracao and not os.path.exists(NOME_ARQUIVO):
+        print("Não existe nenhuma configuração salva. Gerando nova configuração...")
+        carregar_configuracao = False
+
+    if carregar_configuracao:
+        print(f"Carregando configuração existente em {NOME_ARQUIVO}")
+        dist, coordenadas = carregar_tsplib(NOME_ARQUIVO)
+    else:
+        print(f"Gerando cidades aleatórias e salvando em {NOME_ARQUIVO}")
+        coordenadas = gerar_cidades_aleatorias(NUM_CIDADES_GERACAO)
+        salvar_tsplib(coordenadas, NOME_ARQUIVO)
+        dist = matriz_distancias(coordenadas)
+
+    populacao_inicial = gerar_populacao_inicial(N_POPULACAO, len(dist))
+
+    print("Iniciando evolução...")
+    start_time = time.time()
+    with PERFIL.sessao("perfil_algoritmo_genetico_tsp"):
+        melhor, custo_melhor = algoritmo_genetico(populacao_inicial, dist)
+    print(f"Tempo execução: {time.time() - start_time}")
+    print(f"Melhor resultado encontrado: {custo_melhor}")
+
+    if coordenadas is not None:
+        plotar_rota(melhor, coordenadas, custo_melhor, "resultado_caixeiro.png")
+
+def gerar_populacao_inicial(n_populacao: int, n_cidades: int) -> np.ndarray:
+    """Gera uma população inicial de rotas aleatórias.
+
+    Args:
+        n_populacao (int): Número de indivíduos.
+        n_cidades (int): Número de cidades.
+
+    Returns:
+        np.ndarray: Array (n_populacao × n_cidades) com uma rota por linha.
+    """
+    return np.argsort(np.random.random((n_populacao, n_cidades)), axis=1)
+
+def _cortes(n_pares: int, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorteia os pontos de corte a < b de cada par"""
+    pontos = np.sort(np.random.randint(0, n + 1, size=(n_pares, 2)), axis=1)
+    return pontos[:, 0], pontos[:, 1]
+
+def _rotacionar(rotas: np.ndarray, inicio: np.ndarray) -> np.ndarray:
+    """Rotaciona cada linha para que comece na posição dada"""
+    n = rotas.shape[1]
+    return np.take_along_axis(rotas, (np.arange(n) + inicio[:, None]) % n, axis=1)
+
+def _posicoes(rotas: np.ndarray) -> np.ndarray:
+    """Calcula a posição de cada cidade em cada rota"""
+    posicoes = np.empty_like(rotas)
+    np.put_along_axis(posicoes, rotas, np.arange(rotas.shape[1])[None, :], axis=1)
+    return posicoes
+
+def crossover_ox(pais1: np.ndarray, pais2: np.ndarray) -> np.ndarray:
+    """Order crossover (OX) de todos os pares de uma vez.
+
+    O filho recebe o trecho [a, b) do primeiro pai na mesma posição e as
+    demais cidades na ordem em que aparecem no segundo pai a partir de b.
+
+    Args:
+        pais1 (np.ndarray): Primeiros pais (uma rota por linha).
+        pais2 (np.ndarray): Segundos pais (uma rota por linha).
+
+    Returns:
+        np.ndarray: Filhos (uma rota por linha).
+    """
+    n_pares, n = pais1.shape
+    a, b = _cortes(n_pares, n)
+    tam_fora = n - (b - a)
+
+    posicoes1 = _posicoes(pais1)
+    pais2_rot = _rotacionar(pais2, b)
+    posicao_no_pai1 = np.take_along_axis(posicoes1, pais2_rot, axis=1)
+    no_trecho = (posicao_no_pai1 >= a[:, None]) & (posicao_no_pai1 < b[:, None])
+    # ordenação estável que coloca as cidades fora do trecho primeiro, na ordem do segundo pai
+    restantes = np.take_along_axis(pais2_rot, np.argsort(no_trecho, axis=1, kind='stable'), axis=1)
+
+    # a partir de b, as primeiras tam_fora posições vêm do segundo pai e as demais (o trecho) do primeiro
+    valores = np.where(np.arange(n)[None, :] < tam_fora[:, None], restantes, _rotacionar(pais1, b))
+    destinos = (np.arange(n)[None, :] + b[:, None]) % n
+    filhos = np.empty_like(pais1)
+    np.put_along_axis(filhos, destinos, valores, axis=1)
+    return filhos
+
+def crossover_pmx(pais1: np.ndarray, pais2: np.ndarray) -> np.ndarray:
+    """Partially mapped crossover (PMX) de todos os pares de uma vez.
+
+    O filho recebe o trecho [a, b) do primeiro pai e o restante do segundo pai;
+    as cidades repetidas fora do trecho são substituídas seguindo o mapeamento
+    pai1[i] -> pai2[i] do trecho até sair dele.
+
+    Args:
+        pais1 (np.ndarray): Primeiros pais (uma rota por linha).
+        pais2 (np.ndarray): Segundos pais (uma rota por linha).
+
+    Returns:
+        np.ndarray: Filhos (uma rota por linha).
+    """
+    n_pares, n = pais1.shape
+    a, b = _cortes(n_pares, n)
+    indices = np.arange(n)[None, :]
+    trecho = (indices >= a[:, None]) & (indices < b[:, None])
+
+    posicoes1 = _posicoes(pais1)
+    no_trecho_pai1 = np.take_along_axis(trecho, posicoes1, axis=1)  # por cidade
+    mapeamento = np.take_along_axis(pais2, posicoes1, axis=1)        # cidade do pai1 -> cidade do pai2
+
+    filhos = np.where(trecho, pais1, pais2)
+    for _ in range(n):
+        conflito = ~trecho & np.take_along_axis(no_trecho_pai1, filhos, axis=1)
+        if not conflito.any():
+            break
+        filhos = np.where(conflito, np.take_along_axis(mapeamento, filhos, axis=1), filhos)
+    return filhos
+
+def crossover_guloso(pais1: np.ndarray, pais2: np.ndarray, dist: np.ndarray, candidatos: np.ndarray) -> np.ndarray:
+    """Crossover guloso de arestas, de todos os pares de uma vez.
+
+    Cada filho é construído a partir de uma cidade sorteada seguindo, a cada passo,
+    a aresta mais curta para uma cidade não visitada entre as arestas dos dois pais
+    (grafo união A∪B). Se todas já foram visitadas, usa o vizinho mais próximo não
+    visitado da lista de candidatos e, em último caso, a cidade não visitada mais próxima.
+
+    Como o grafo união é simétrico, trocar a ordem dos pais não produz um filho
+    diferente; por isso cada par gera apenas um filho por este operador.
+
+    Args:
+        pais1 (np.ndarray): Primeiros pais (uma rota por linha).
+        pais2 (np.ndarray): Segundos pais (uma rota por linha).
+        dist (np.ndarray): Matriz de distâncias.
+        candidatos (np.ndarray): Listas de vizinhos mais próximos.
+
+    Returns:
+        np.ndarray: Filhos (uma rota por linha).
+    """
+    n_pares, n = pais1.shape
+    pares = np.arange(n_pares)
+
+    # vizinhos de cada cidade no grafo união: sucessor e antecessor em cada pai
+    vizinhos = np.empty((n_pares, n, 4), dtype=pais1.dtype)
+    for k, (pai, deslocamento) in enumerate([(pais1, -1), (pais1, 1), (pais2, -1), (pais2, 1)]):
+        np.put_along_axis(vizinhos[:, :, k], pai, np.roll(pai, deslocamento, axis=1), axis=1)
+    vizinhos = np.concatenate([vizinhos, np.broadcast_to(candidatos, (n_pares,) + candidatos.shape)], axis=2)
+    n_vizinhos_pais = 4
+
+    filhos = np.empty_like(pais1)
+    visitados = np.zeros((n_pares, n), dtype=bool)
+    atual = np.random.randint(0, n, size=n_pares)
+    filhos[:, 0] = atual
+    visitados[pares, atual] = True
+
+    for passo in range(1, n):
+        opcoes = vizinhos[pares, atual]
+        distancias = dist[atual[:, None], opcoes]
+        distancias[visitados[pares[:, None], opcoes]] = np.inf
+        # arestas dos pais têm prioridade sobre os candidatos
+        distancias[:, n_vizinhos_pais:] += np.where(np.isfinite(distancias[:, :n_vizinhos_pais]).any(axis=1), np.inf, 0.0)[:, None]
+        escolha = np.argmin(distancias, axis=1)
+        proximo = opcoes[pares, escolha]
+
+        sem_opcao = ~np.isfinite(distancias[pares, escolha])
+        if sem_opcao.any():
+            PERFIL.contar("guloso_passos_fora_candidatos", int(sem_opcao.sum()))
+            linhas = np.where(visitados[sem_opcao], np.inf, dist[atual[sem_opcao]])
+            proximo[sem_opcao] = np.argmin(linhas, axis=1)
+
+        filhos[:, passo] = proximo
+        visitados[pares, proximo] = True
+        atual = proximo
+
+    return filhos
+
+def mutacao_2opt(populacao: np.ndarray, p_mutacao: float) -> np.ndarray:
+    """Aplica a mutação 2-opt (inversão de um trecho aleatório) aos indivíduos sorteados.
+
+    Args:
+        populacao (np.ndarray): Rotas (uma por linha).
+        p_mutacao (float): Probabilidade de mutação de cada indivíduo.
+
+    Returns:
+        np.ndarray: Rotas após a mutação.
+    """
+    n_individuos, n = populacao.shape
+    mutados = np.flatnonzero(np.random.random(n_individuos) < p_mutacao)
+    if len(mutados) == 0:
+        return populacao
+
+    i, j = _cortes(len(mutados), n)
+    indices = np.arange(n)[None, :]
+    dentro = (indices >= i[:, None]) & (indices < j[:, None])
+    origem = np.where(dentro, i[:, None] + j[:, None] - 1 - indices, indices)
+    populacao[mutados] = np.take_along_axis(populacao[mutados], origem, axis=1)
+    return populacao
+
+def algoritmo_genetico(populacao_inicial: np.ndarray, dist: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Executa o algoritmo genético para o caixeiro viajante.
+
+    Args:
+        populacao_inicial (np.ndarray): Rotas iniciais (uma por linha).
+        dist (np.ndarray): Matriz de distâncias entre as cidades.
+
+    Returns:
+        Tuple[np.ndarray, float]: Melhor rota encontrada e o seu comprimento.
+    """
+    populacao = populacao_inicial
+    candidatos = listas_candidatos(dist, NUM_CANDIDATOS) if CROSSOVER == "guloso" else None
+    with PERFIL.fase("avaliacao"):
+        custos = comprimentos_rotas(populacao, dist)
+
+    for i in range(1, N_GERACOES + 1):
+        with PERFIL.fase("selecao"):
+            pais = populacao[torneio(-custos, N_POPULACAO, TAMANHO_TORNEIO)]
+        pais1, pais2 = pais[::2], pais[1::2]
+
+        with PERFIL.fase("crossover"):
+            if CROSSOVER == "ox":
+                filhos = np.concatenate([crossover_ox(pais1, pais2), crossover_ox(pais2, pais1)])
+            elif CROSSOVER == "pmx":
+                filhos = np.concatenate([crossover_pmx(pais1, pais2), crossover_pmx(pais2, pais1)])
+            elif CROSSOVER == "guloso":
+                # o segundo filho vem do OX, já que o guloso é simétrico nos pais
+                filhos = np.concatenate([crossover_guloso(pais1, pais2, dist, candidatos),
+                                         crossover_ox(pais2, pais1)])
+            else:
+                raise ValueError(f"Crossover desconhecido: {CROSSOVER}")
+
+        with PERFIL.fase("mutacao"):
+            filhos = mutacao_2opt(filhos, P_MUTACAO)
+
+        with PERFIL.fase("avaliacao"):
+            custos_filhos = comprimentos_rotas(filhos, dist)
+
+        with PERFIL.fase("ordenacao"):
+            populacao = np.concatenate([populacao, filhos])
+            custos = np.concatenate([custos, custos_filhos])
+            sobreviventes = selecionar_sobreviventes(-custos, N_POPULACAO, N_POPULACAO // 2)
+            populacao, custos = populacao[sobreviventes], custos[sobreviventes]
+
+        if i % GEN_IMPRIMIR == 0:
+            print(f"Geração {i}: Custo melhor solução = {custos[0]};")
+
+    return populacao[0], float(custos[0])
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
 import random
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from comum.perfil import PERFIL
 from model import *
 from plot import *
+from evolucao import evoluir_geracao
 
 N_POPULACAO = 100
 N_GERACOES = 1000
 P_MUTACAO = 0.2
+TAMANHO_TORNEIO = 2
 GEN_RENDERIZAR = 25
 TAM_INDIVIDUO = (50, 50)
 TAM_PECA = (15, 15)
@@ -30,7 +36,8 @@ def main():
     populacao_inicial = Individuo.gerar_populacao_inicial(N_POPULACAO, pecas, TAM_INDIVIDUO)
 
     print("Iniciando evolução...")
-    melhor = algoritmo_genetico(populacao_inicial)
+    with PERFIL.sessao("perfil_algoritmo_genetico"):
+        melhor = algoritmo_genetico(populacao_inicial)
     print(f"Melhor resultado encontrado: {melhor.fitness:.5f}")
 
 
@@ -38,26 +45,17 @@ def algoritmo_genetico(populacao_inicial: List[Individuo]):
     populacao = sorted(populacao_inicial, key=lambda individuo: -individuo.fitness)
 
     fig, axs = prepar_plot(N_POPULACAO)
-    renderizar_graficos(populacao, 1, fig, axs)
+    with PERFIL.fase("renderizacao"):
+        renderizar_graficos(populacao, 1, fig, axs)
 
     for i in range(1, N_GERACOES + 1):
-        random.shuffle(populacao)
-        pares = [populacao[i:i+2] for i in range(0, len(populacao), 2)]
-        pares = list(zip(pares[0], pares[1]))
-
-        for pai1, pai2 in zip(populacao[::2], populacao[1::2]):
-            filho1, filho2 = pai1.crossover(pai2), pai2.crossover(pai1)
-            if random.random() < P_MUTACAO: filho1.mutacao()
-            if random.random() < P_MUTACAO: filho2.mutacao()
-            populacao += [filho1, filho2]
-
-        populacao = sorted(populacao, key=lambda individuo: -individuo.fitness)
-        elitismo = N_POPULACAO // 2
-        populacao = populacao[:elitismo] + random.sample(populacao[elitismo:], k=N_POPULACAO - elitismo)
+        populacao = evoluir_geracao(populacao, N_POPULACAO, P_MUTACAO, TAMANHO_TORNEIO)
 
         if i % GEN_RENDERIZAR == 0:
-            renderizar_graficos(populacao, i, fig, axs)
-    renderizar_graficos(populacao, 1000, fig, axs, "resultado_corte.png")
+            with PERFIL.fase("renderizacao"):
+                renderizar_graficos(populacao, i, fig, axs)
+    with PERFIL.fase("renderizacao"):
+        renderizar_graficos(populacao, 1000, fig, axs, "resultado_corte.png")
     return populacao[0]
 
 if __name__ == "__main__":
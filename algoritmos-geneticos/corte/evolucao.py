@@ -0,0 +1,36 @@
+import random
+import numpy as np
+from comum.perfil import PERFIL
+from comum.selecao import torneio, selecionar_sobreviventes
+from model import *
+
+def evoluir_geracao(populacao: List[Individuo], n_populacao: int, p_mutacao: float, tamanho_torneio: int) -> List[Individuo]:
+    """
+    Executa uma geração do algoritmo genético: seleção dos pais por torneio,
+    crossover, mutação e seleção dos sobreviventes por elitismo.
+
+    Args:
+        populacao (List[Individuo]): População atual.
+        n_populacao (int): Tamanho da população.
+        p_mutacao (float): Probabilidade de mutação de cada filho.
+        tamanho_torneio (int): Número de competidores em cada torneio.
+
+    Returns:
+        List[Individuo]: Nova população, com a elite primeiro e em ordem decrescente de fitness.
+    """
+    with PERFIL.fase("selecao"):
+        fitness = np.array([individuo.fitness for individuo in populacao])
+        pais = [populacao[p] for p in torneio(fitness, n_populacao, tamanho_torneio)]
+
+    populacao = list(populacao)
+    for pai1, pai2 in zip(pais[::2], pais[1::2]):
+        with PERFIL.fase("crossover"):
+            filho1, filho2 = pai1.crossover(pai2), pai2.crossover(pai1)
+        with PERFIL.fase("mutacao"):
+            if random.random() < p_mutacao: filho1.mutacao()
+            if random.random() < p_mutacao: filho2.mutacao()
+        populacao += [filho1, filho2]
+
+    with PERFIL.fase("ordenacao"):
+        fitness = np.array([individuo.fitness for individuo in populacao])
+        return [populacao[s] for s in selecionar_sobreviventes(fitness, n_populacao, n_populacao // 2)]
@@ -0,0 +1,537 @@
+import os
+import sys
+import random
+import pickle
+import argparse
+import threading
+import queue
+import socket
+import struct
+import hmac
+import hashlib
+import multiprocessing as mp
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from comum.perfil import PERFIL
+from model import *
+from evolucao import evoluir_geracao
+
+"""
+Modelo de ilhas para o algoritmo genético do corte de estoque.
+
+Cada ilha evolui a sua própria população em um processo separado e, a cada
+INTERVALO_MIGRACAO gerações, envia cópias dos seus melhores indivíduos para
+outra ilha, escolhida pela topologia (anel ou aleatória). Os migrantes recebidos
+substituem os piores indivíduos da população. A migração é assíncrona: uma ilha
+nunca espera pelas outras, apenas incorpora os migrantes que já chegaram.
+
+Os migrantes trafegam por filas do multiprocessing (todas as ilhas na mesma
+máquina) ou por TCP (uma ilha por endereço, possivelmente em máquinas
+diferentes, todas com o mesmo arquivo de peças). Cada ilha salva
+periodicamente um checkpoint da sua população; com --retomar, uma execução
+interrompida continua a partir dele. O checkpoint guarda as peças e a
+configuração da execução e é ignorado se elas não coincidirem, e é apagado
+quando a ilha termina.
+
+Uso:
+    python ilhas.py                          executa todas as ilhas localmente
+    python ilhas.py --ilha 0 --enderecos h1:6000,h2:6000,h3:6000
+                                             executa apenas a ilha 0 (por TCP)
+    python ilhas.py --retomar                retoma a partir dos checkpoints
+"""
+
+N_ILHAS = 4
+N_POPULACAO_ILHA = 50
+N_GERACOES = 500
+P_MUTACAO = 0.2
+TAMANHO_TORNEIO = 2
+INTERVALO_MIGRACAO = 10
+N_MIGRANTES = 2
+TOPOLOGIA = "anel" # "anel" ou "aleatoria"
+TRANSPORTE = "fila" # "fila" ou "tcp"
+HOST = "localhost"
+PORTA_BASE = 6000
+CHAVE_AUTENTICACAO = b"algoritmos-otimizacao"
+TIMEOUT_TCP = 10 # segundos para conectar, enviar ou receber uma mensagem antes de desistir
+TAMANHO_FILA_ENVIO = 10 # envios pendentes por destino antes de começar a descartar migrantes
+TAMANHO_MAXIMO_MENSAGEM = 16 * 1024 * 1024 # bytes; mensagens maiores são recusadas sem serem lidas
+INTERVALO_CHECKPOINT = 50
+INTERVALO_VERIFICACAO = 5 # segundos entre verificações de ilhas que terminaram com erro
+PASTA_CHECKPOINT = "checkpoints"
+TAM_INDIVIDUO = (50, 50)
+TAM_PECA = (15, 15)
+N_PECAS = 10
+NOME_ARQUIVO = "pecas_2"
+
+
+class TransporteFila:
+    """
+    Transporte de migrantes por filas do multiprocessing, para ilhas na mesma máquina.
+
+    Args:
+        filas (List[mp.Queue]): Fila de entrada de cada ilha
+        ilha (int): Índice da ilha dona deste transporte
+    """
+
+    def __init__(self, filas: List[mp.Queue], ilha: int):
+        self.filas = filas
+        self.ilha = ilha
+
+    def iniciar(self):
+        """Prepara o transporte no processo da ilha"""
+        # migrantes que ninguém chegou a ler não devem impedir o processo de terminar
+        for fila in self.filas:
+            fila.cancel_join_thread()
+
+    def enviar(self, destino: int, migrantes: List[Individuo]):
+        """Envia os migrantes para a ilha de destino"""
+        self.filas[destino].put(migrantes)
+
+    def receber(self) -> List[Individuo]:
+        """Retorna todos os migrantes que chegaram desde a última chamada, sem bloquear"""
+        recebidos = []
+        while True:
+            try:
+                recebidos += self.filas[self.ilha].get_nowait()
+            except queue.Empty:
+                return recebidos
+
+    def encerrar(self):
+        """Libera os recursos do transporte"""
+        pass
+
+
+def _enviar_mensagem(conexao: socket.socket, objeto, chave: bytes):
+    """
+    Envia um objeto pelo socket. A mensagem é o tamanho do conteúdo (4 bytes),
+    o HMAC-SHA256 do conteúdo com a chave e o conteúdo serializado com pickle.
+    """
+    conteudo = pickle.dumps(objeto)
+    assinatura = hmac.new(chave, conteudo, hashlib.sha256).digest()
+    conexao.sendall(struct.pack("!I", len(conteudo)) + assinatura + conteudo)
+
+
+def _receber_exatamente(conexao: socket.socket, n: int) -> bytes:
+    """Lê exatamente n bytes do socket"""
+    dados = bytearray()
+    while len(dados) < n:
+        parte = conexao.recv(n - len(dados))
+        if not parte:
+            raise ConnectionError("conexão encerrada no meio da mensagem")
+        dados += parte
+    return bytes(dados)
+
+
+def _receber_mensagem(conexao: socket.socket, chave: bytes):
+    """
+    Recebe um objeto enviado por `_enviar_mensagem`. O conteúdo só é
+    desserializado depois que o HMAC é verificado.
+
+    Raises:
+        ValueError: Se a mensagem for grande demais ou a assinatura não conferir
+    """
+    tamanho, = struct.unpack("!I", _receber_exatamente(conexao, 4))
+    if tamanho > TAMANHO_MAXIMO_MENSAGEM:
+        raise ValueError(f"mensagem de {tamanho} bytes excede o limite")
+    assinatura = _receber_exatamente(conexao, hashlib.sha256().digest_size)
+    conteudo = _receber_exatamente(conexao, tamanho)
+    if not hmac.compare_digest(assinatura, hmac.new(chave, conteudo, hashlib.sha256).digest()):
+        raise ValueError("assinatura da mensagem inválida")
+    return pickle.loads(conteudo)
+
+
+class TransporteTCP:
+    """
+    Transporte de migrantes por TCP, para ilhas em máquinas diferentes.
+
+    Cada ilha escuta no seu endereço; uma thread aceita as conexões e cada
+    conexão é lida em uma thread própria, com TIMEOUT_TCP para chegar a
+    mensagem inteira, de forma que um cliente lento ou silencioso não impede as
+    demais migrações. Cada mensagem leva um HMAC calculado com a chave, e
+    mensagens com a assinatura errada são descartadas sem serem desserializadas.
+
+    Os envios são feitos por uma thread e uma fila por destino, com TIMEOUT_TCP
+    para conectar e enviar, para que um destino travado não bloqueie a evolução
+    nem as migrações para as outras ilhas. Migrantes enviados para uma ilha que
+    ainda não está (ou já não está) escutando, ou que não couberem na fila de
+    envio do destino, são descartados.
+
+    Args:
+        enderecos (List[Tuple[str, int]]): Endereço (host, porta) de cada ilha
+        ilha (int): Índice da ilha dona deste transporte
+        chave (bytes): Chave usada para assinar as mensagens
+    """
+
+    def __init__(self, enderecos: List[Tuple[str, int]], ilha: int, chave: bytes = CHAVE_AUTENTICACAO):
+        self.enderecos = enderecos
+        self.ilha = ilha
+        self.chave = chave
+        self.servidor = None
+        self.envios = {}
+
+    def iniciar(self):
+        """Começa a escutar no endereço da ilha"""
+        self.recebidos = queue.Queue()
+        self.servidor = socket.create_server(self.enderecos[self.ilha])
+        threading.Thread(target=self._aceitar, args=(self.servidor,), daemon=True).start()
+
+    def _aceitar(self, servidor: socket.socket):
+        """Aceita conexões até o servidor ser fechado"""
+        while True:
+            try:
+                conexao, _ = servidor.accept()
+            except OSError:
+                if self.servidor is None:
+                    return
+                PERFIL.contar("migracoes_com_erro")
+                continue
+            conexao.settimeout(TIMEOUT_TCP)
+            threading.Thread(target=self._receber_conexao, args=(conexao,), daemon=True).start()
+
+    def _receber_conexao(self, conexao: socket.socket):
+        """Lê uma mensagem da conexão e guarda os migrantes recebidos"""
+        try:
+            with conexao:
+                self.recebidos.put(_receber_mensagem(conexao, self.chave))
+        except Exception:
+            # tempo esgotado, conexão encerrada, assinatura inválida ou dados inválidos
+            PERFIL.contar("migracoes_com_erro")
+
+    def enviar(self, destino: int, migrantes: List[Individuo]):
+        """Agenda o envio dos migrantes para a ilha de destino, sem bloquear"""
+        if destino not in self.envios:
+            self.envios[destino] = queue.Queue(maxsize=TAMANHO_FILA_ENVIO)
+            threading.Thread(target=self._enviar_pendentes, args=(destino,), daemon=True).start()
+        try:
+            self.envios[destino].put_nowait(migrantes)
+        except queue.Full:
+            PERFIL.contar("migracoes_descartadas")
+
+    def _enviar_pendentes(self, destino: int):
+        """Envia os migrantes agendados para um destino"""
+        fila = self.envios[destino]
+        while True:
+            migrantes = fila.get()
+            try:
+                with socket.create_connection(self.enderecos[destino], timeout=TIMEOUT_TCP) as conexao:
+                    _enviar_mensagem(conexao, migrantes, self.chave)
+            except OSError:
+                PERFIL.contar("migracoes_descartadas")
+
+    def receber(self) -> List[Individuo]:
+        """Retorna todos os migrantes que chegaram desde a última chamada, sem bloquear"""
+        recebidos = []
+        while True:
+            try:
+                recebidos += self.recebidos.get_nowait()
+            except queue.Empty:
+                return recebidos
+
+    def encerrar(self):
+        """Para de escutar"""
+        servidor, self.servidor = self.servidor, None
+        if servidor is not None:
+            # shutdown acorda a thread bloqueada no accept
+            try:
+                servidor.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            servidor.close()
+
+
+def escolher_destino(ilha: int, n_ilhas: int, topologia: str) -> int:
+    """
+    Escolhe a ilha que recebe os migrantes.
+
+    Args:
+        ilha (int): Índice da ilha de origem
+        n_ilhas (int): Número de ilhas
+        topologia (str): "anel" (sempre a próxima ilha) ou "aleatoria" (qualquer outra ilha)
+
+    Returns:
+        int: Índice da ilha de destino
+    """
+    if topologia == "anel":
+        return (ilha + 1) % n_ilhas
+    if topologia == "aleatoria":
+        return random.choice([i for i in range(n_ilhas) if i != ilha])
+    raise ValueError(f"Topologia desconhecida: {topologia}")
+
+
+def caminho_checkpoint(ilha: int) -> str:
+    """Retorna o caminho do arquivo de checkpoint de uma ilha"""
+    return os.path.join(PASTA_CHECKPOINT, f"ilha_{ilha}.pkl")
+
+
+def assinatura_execucao(pecas: List[Peca], n_ilhas: int) -> tuple:
+    """
+    Identifica a execução a que um checkpoint pertence: as peças (id e tamanho),
+    o tamanho do indivíduo e a configuração do modelo de ilhas.
+
+    Args:
+        pecas (List[Peca]): Peças a serem posicionadas
+        n_ilhas (int): Número de ilhas
+
+    Returns:
+        tuple: Assinatura da execução
+    """
+    return (tuple((peca.id, peca.largura, peca.altura) for peca in pecas), TAM_INDIVIDUO,
+            N_GERACOES, N_POPULACAO_ILHA, n_ilhas)
+
+
+def salvar_checkpoint(ilha: int, geracao: int, populacao: List[Individuo], assinatura: tuple) -> None:
+    """
+    Salva a população da ilha e o estado dos geradores aleatórios usando pickle.
+    O arquivo é escrito em um temporário e renomeado, para que um checkpoint
+    interrompido no meio não corrompa o anterior.
+
+    Args:
+        ilha (int): Índice da ilha
+        geracao (int): Última geração concluída
+        populacao (List[Individuo]): População da ilha
+        assinatura (tuple): Assinatura da execução, ver `assinatura_execucao`
+    """
+    os.makedirs(PASTA_CHECKPOINT, exist_ok=True)
+    arquivo = caminho_checkpoint(ilha)
+    checkpoint = {
+        "assinatura": assinatura,
+        "geracao": geracao,
+        "populacao": populacao,
+        "estado_random": random.getstate(),
+        "estado_numpy": np.random.get_state(),
+    }
+    with open(arquivo + ".tmp", 'wb') as f:
+        pickle.dump(checkpoint, f)
+    os.replace(arquivo + ".tmp", arquivo)
+
+
+def carregar_checkpoint(ilha: int, assinatura: tuple) -> Optional[Tuple[int, List[Individuo]]]:
+    """
+    Carrega o checkpoint da ilha, restaurando o estado dos geradores aleatórios.
+    Checkpoints de outra execução (peças ou configuração diferentes) são ignorados.
+
+    Args:
+        ilha (int): Índice da ilha
+        assinatura (tuple): Assinatura da execução atual, ver `assinatura_execucao`
+
+    Returns:
+        Optional[Tuple[int, List[Individuo]]]: Última geração concluída e população,
+        ou None se não existir checkpoint compatível
+    """
+    arquivo = caminho_checkpoint(ilha)
+    if not os.path.exists(arquivo):
+        return None
+    with open(arquivo, 'rb') as f:
+        checkpoint = pickle.load(f)
+    if not isinstance(checkpoint, dict) or checkpoint.get("assinatura") != assinatura:
+        print(f"Ilha {ilha}: checkpoint em {arquivo} é de outra execução (peças ou configuração diferentes), ignorando")
+        return None
+    random.setstate(checkpoint["estado_random"])
+    np.random.set_state(checkpoint["estado_numpy"])
+    return checkpoint["geracao"], checkpoint["populacao"]
+
+
+def remover_checkpoint(ilha: int) -> None:
+    """Apaga o checkpoint da ilha, se existir"""
+    arquivo = caminho_checkpoint(ilha)
+    if os.path.exists(arquivo):
+        os.remove(arquivo)
+
+
+def executar_ilha(ilha: int, n_ilhas: int, pecas: List[Peca], transporte, semente: int,
+                  retomar: bool = False) -> Individuo:
+    """
+    Evolui a população de uma ilha, trocando migrantes com as demais.
+
+    Args:
+        ilha (int): Índice da ilha
+        n_ilhas (int): Número de ilhas
+        pecas (List[Peca]): Peças a serem posicionadas
+        transporte: TransporteFila ou TransporteTCP usado nas migrações
+        semente (int): Semente dos geradores aleatórios
+        retomar (bool): Se True, continua a partir do checkpoint da ilha, se houver um compatível
+
+    Returns:
+        Individuo: Melhor indivíduo da ilha
+    """
+    random.seed(semente + ilha)
+    np.random.seed(semente + ilha)
+    transporte.iniciar()
+
+    assinatura = assinatura_execucao(pecas, n_ilhas)
+    checkpoint = carregar_checkpoint(ilha, assinatura) if retomar else None
+    if checkpoint is not None:
+        inicio, populacao = checkpoint
+        print(f"Ilha {ilha}: retomando da geração {inicio}")
+    else:
+        inicio = 0
+        populacao = Individuo.gerar_populacao_inicial(N_POPULACAO_ILHA, pecas, TAM_INDIVIDUO)
+
+    try:
+        for geracao in range(inicio + 1, N_GERACOES + 1):
+            populacao = evoluir_geracao(populacao, N_POPULACAO_ILHA, P_MUTACAO, TAMANHO_TORNEIO)
+
+            with PERFIL.fase("migracao"):
+                migrantes = transporte.receber()
+                if migrantes:
+                    PERFIL.contar("migrantes_recebidos", len(migrantes))
+                    n_substituidos = min(len(migrantes), N_POPULACAO_ILHA)
+                    populacao = sorted(populacao, key=lambda individuo: -individuo.fitness)
+                    populacao = populacao[:N_POPULACAO_ILHA - n_substituidos] + migrantes[:n_substituidos]
+                    populacao = sorted(populacao, key=lambda individuo: -individuo.fitness)
+
+                if n_ilhas > 1 and geracao % INTERVALO_MIGRACAO == 0:
+                    elite = sorted(populacao, key=lambda individuo: -individuo.fitness)[:N_MIGRANTES]
+                    transporte.enviar(escolher_destino(ilha, n_ilhas, TOPOLOGIA), elite)
+
+            if geracao % INTERVALO_CHECKPOINT == 0:
+                with PERFIL.fase("checkpoint"):
+                    salvar_checkpoint(ilha, geracao, populacao, assinatura)
+                print(f"Ilha {ilha} - geração {geracao}: melhor fitness = {populacao[0].fitness:.5f}")
+    finally:
+        transporte.encerrar()
+
+    # a execução terminou: o checkpoint não serve mais para retomá-la
+    remover_checkpoint(ilha)
+
+    return max(populacao, key=lambda individuo: individuo.fitness)
+
+
+def _processo_ilha(ilha: int, n_ilhas: int, pecas: List[Peca], transporte, semente: int, retomar: bool,
+                   resultados: mp.Queue):
+    """Ponto de entrada do processo de uma ilha"""
+    with PERFIL.sessao(f"perfil_ilha_{ilha}"):
+        melhor = executar_ilha(ilha, n_ilhas, pecas, transporte, semente, retomar)
+    resultados.put((ilha, melhor))
+
+
+def _aguardar_resultados(processos: List[mp.Process], resultados: mp.Queue) -> dict:
+    """
+    Recebe o melhor indivíduo de cada ilha, verificando periodicamente se algum
+    processo terminou sem enviar o seu resultado.
+
+    Args:
+        processos (List[mp.Process]): Processo de cada ilha
+        resultados (mp.Queue): Fila em que as ilhas colocam (índice, melhor indivíduo)
+
+    Returns:
+        dict: Melhor indivíduo de cada ilha, indexado pelo índice da ilha
+
+    Raises:
+        RuntimeError: Se uma ilha terminar sem enviar o resultado
+    """
+    melhores = {}
+    while len(melhores) < len(processos):
+        try:
+            ilha, melhor = resultados.get(timeout=INTERVALO_VERIFICACAO)
+            melhores[ilha] = melhor
+            continue
+        except queue.Empty:
+            pass
+
+        for ilha, processo in enumerate(processos):
+            if ilha in melhores or processo.is_alive():
+                continue
+            # o resultado pode ter sido enviado logo antes do processo terminar
+            try:
+                while True:
+                    ilha_resultado, melhor = resultados.get(timeout=1)
+                    melhores[ilha_resultado] = melhor
+            except queue.Empty:
+                pass
+            if ilha not in melhores:
+                raise RuntimeError(f"Ilha {ilha} terminou sem enviar o resultado (código de saída {processo.exitcode})")
+    return melhores
+
+
+def modelo_ilhas(pecas: List[Peca], n_ilhas: int = N_ILHAS, transporte: str = TRANSPORTE,
+                 semente: Optional[int] = None, retomar: bool = False) -> Individuo:
+    """
+    Executa todas as ilhas na máquina local, cada uma em um processo.
+
+    Args:
+        pecas (List[Peca]): Peças a serem posicionadas
+        n_ilhas (int): Número de ilhas
+        transporte (str): "fila" para filas do multiprocessing ou "tcp" para sockets em localhost
+        semente (int): Semente dos geradores aleatórios. Se None, é sorteada.
+        retomar (bool): Se True, cada ilha continua a partir do seu checkpoint, se houver um compatível
+
+    Returns:
+        Individuo: Melhor indivíduo entre todas as ilhas
+    """
+    if semente is None:
+        semente = random.getrandbits(32)
+
+    filas = [mp.Queue() for _ in range(n_ilhas)]
+    enderecos = [(HOST, PORTA_BASE + i) for i in range(n_ilhas)]
+    resultados = mp.Queue()
+
+    processos = []
+    for ilha in range(n_ilhas):
+        if transporte == "fila":
+            transporte_ilha = TransporteFila(filas, ilha)
+        elif transporte == "tcp":
+            transporte_ilha = TransporteTCP(enderecos, ilha)
+        else:
+            raise ValueError(f"Transporte desconhecido: {transporte}")
+        processo = mp.Process(target=_processo_ilha, args=(ilha, n_ilhas, pecas, transporte_ilha, semente, retomar, resultados))
+        processo.start()
+        processos.append(processo)
+
+    try:
+        melhores = _aguardar_resultados(processos, resultados)
+    except BaseException:
+        for processo in processos:
+            if processo.is_alive():
+                processo.terminate()
+        raise
+    finally:
+        for processo in processos:
+            processo.join()
+
+    for ilha, melhor in sorted(melhores.items()):
+        print(f"Ilha {ilha}: melhor fitness = {melhor.fitness:.5f}")
+    return max(melhores.values(), key=lambda individuo: individuo.fitness)
+
+
+def carregar_ou_gerar_pecas() -> List[Peca]:
+    """Carrega as peças salvas em NOME_ARQUIVO ou gera e salva peças aleatórias"""
+    if os.path.exists(NOME_ARQUIVO):
+        print(f"Carregando configuração existente em {NOME_ARQUIVO}")
+        return Peca.carregar_pecas(NOME_ARQUIVO)
+    print(f"Gerando pecas aleatórias e salvando em {NOME_ARQUIVO}")
+    pecas = Peca.gerar_pecas_aleatorias(N_PECAS, TAM_PECA[0], TAM_PECA[1])
+    Peca.salvar_pecas(pecas, NOME_ARQUIVO)
+    return pecas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Modelo de ilhas para o corte de estoque 2D")
+    parser.add_argument("--ilha", type=int, help="executa apenas esta ilha, com transporte TCP")
+    parser.add_argument("--enderecos", help="endereços host:porta de todas as ilhas, separados por vírgula")
+    parser.add_argument("--semente", type=int, help="semente dos geradores aleatórios (sorteada se omitida)")
+    parser.add_argument("--retomar", action="store_true", help="continua a partir dos checkpoints salvos")
+    args = parser.parse_args()
+
+    semente = args.semente if args.semente is not None else random.getrandbits(32)
+
+    pecas = carregar_ou_gerar_pecas()
+
+    if args.ilha is None:
+        melhor = modelo_ilhas(pecas, semente=semente, retomar=args.retomar)
+    else:
+        if not args.enderecos:
+            parser.error("--enderecos é obrigatório com --ilha")
+        enderecos = [(host, int(porta)) for host, porta in (e.rsplit(":", 1) for e in args.enderecos.split(","))]
+        transporte = TransporteTCP(enderecos, args.ilha)
+        with PERFIL.sessao(f"perfil_ilha_{args.ilha}"):
+            melhor = executar_ilha(args.ilha, len(enderecos), pecas, transporte, semente, args.retomar)
+
+    print(f"Melhor resultado encontrado: {melhor.fitness:.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import random
 import pickle
 from typing import List, Tuple
+from comum.perfil import PERFIL
 
 class Peca:
     """
@@ -141,13 +142,15 @@ class Individuo:
         """
         self.pecas = []
         for peca in pecas:
-            for _ in range(1000):
+            for tentativa in range(1000):
                 x = random.randint(0, self.largura - peca.largura)
                 y = random.randint(0, self.altura - peca.altura)
                 if self.inserir_peca(peca, x, y):
                     break
             else:
                 self.calcular_fitness()
+                PERFIL.contar("pecas_nao_posicionadas")
+            PERFIL.contar("tentativas_posicionamento", tentativa)
     
     def calcular_fitness(self):
         """calcula o fitness do indivíduo com base na área total ocupada pelas peças e a
@@ -205,11 +208,12 @@ class Individuo:
         peca_mutada = random.choice(self.pecas)
         self.pecas.remove(peca_mutada)
         
-        for _ in range(10000):
+        for tentativa in range(10000):
             x = random.randint(0, self.largura - peca_mutada.largura)
             y = random.randint(0, self.altura - peca_mutada.altura)
             if self.inserir_peca(peca_mutada, x, y):
                 break
+        PERFIL.contar("tentativas_mutacao", tentativa)
         
         self.pecas = sorted(self.pecas, key=lambda p: p.id)
         
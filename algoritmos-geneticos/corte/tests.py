@@ -0,0 +1,60 @@
+import time
+import socket
+import ilhas
+from ilhas import *
+from comum.perfil import PERFIL
+
+if __name__ == "__main__":
+    # configuração reduzida para os testes rodarem em poucos segundos
+    ilhas.N_GERACOES = 20
+    ilhas.N_POPULACAO_ILHA = 10
+    ilhas.INTERVALO_MIGRACAO = 5
+    ilhas.INTERVALO_CHECKPOINT = 10
+    ilhas.PORTA_BASE = 6100
+    pecas = Peca.gerar_pecas_aleatorias(N_PECAS, TAM_PECA[0], TAM_PECA[1])
+
+    with PERFIL.sessao("perfil_ilhas"):
+        # Caso de teste 1
+        # Duas ilhas locais migrando por filas do multiprocessing
+        # Resultado esperado: um indivíduo e nenhum checkpoint restante
+        melhor = modelo_ilhas(pecas, n_ilhas=2, transporte="fila", semente=1)
+        restantes = [i for i in range(2) if os.path.exists(caminho_checkpoint(i))]
+        print(f"\nFila: fitness {melhor.fitness:.5f}, checkpoints restantes {restantes} (Esperado: [])\n")
+
+        # Caso de teste 2
+        # Duas ilhas locais migrando por TCP em localhost
+        # Resultado esperado: um indivíduo e nenhum checkpoint restante
+        melhor = modelo_ilhas(pecas, n_ilhas=2, transporte="tcp", semente=1)
+        restantes = [i for i in range(2) if os.path.exists(caminho_checkpoint(i))]
+        print(f"\nTCP: fitness {melhor.fitness:.5f}, checkpoints restantes {restantes} (Esperado: [])\n")
+
+        # Caso de teste 3
+        # Um cliente que conecta e não envia nada e outro com a chave errada não
+        # impedem a chegada dos migrantes enviados com a chave correta
+        # Resultado esperado: apenas os 2 migrantes legítimos são recebidos
+        enderecos = [(HOST, 6200), (HOST, 6201)]
+        origem, destino = TransporteTCP(enderecos, 0), TransporteTCP(enderecos, 1)
+        intruso = TransporteTCP(enderecos, 0, chave=b"chave-errada")
+        destino.iniciar()
+        silencioso = socket.create_connection(enderecos[1])
+        intruso.enviar(1, Individuo.gerar_populacao_inicial(3, pecas, TAM_INDIVIDUO))
+        origem.enviar(1, Individuo.gerar_populacao_inicial(2, pecas, TAM_INDIVIDUO))
+        recebidos = []
+        limite = time.time() + 5
+        while len(recebidos) < 2 and time.time() < limite:
+            recebidos += destino.receber()
+            time.sleep(0.05)
+        time.sleep(0.5)
+        recebidos += destino.receber()
+        silencioso.close()
+        destino.encerrar()
+        print(f"\nTCP com clientes inválidos: {len(recebidos)} migrantes recebidos (Esperado: 2)\n")
+
+        # Caso de teste 4
+        # Ilha interrompida depois do checkpoint da geração 10
+        # Resultado esperado: a ilha retoma da geração 10 e apaga o checkpoint ao terminar
+        assinatura = assinatura_execucao(pecas, 1)
+        populacao = Individuo.gerar_populacao_inicial(ilhas.N_POPULACAO_ILHA, pecas, TAM_INDIVIDUO)
+        salvar_checkpoint(0, 10, populacao, assinatura)
+        melhor = executar_ilha(0, 1, pecas, TransporteFila([mp.Queue()], 0), semente=1, retomar=True)
+        print(f"\nRetomada: fitness {melhor.fitness:.5f}, checkpoint restante {os.path.exists(caminho_checkpoint(0))} (Esperado: False)\n")
@@ -0,0 +1,182 @@
+import os
+import sys
+import time
+from typing import Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from comum.perfil import PERFIL
+from comum.tsp import (carregar_tsplib, salvar_tsplib, gerar_cidades_aleatorias, matriz_distancias,
+                       listas_candidatos, comprimentos_rotas, comprimento_rota, rota_vizinho_mais_proximo,
+                       busca_local, plotar_rota)
+
+# Parâmetros do Ant System
+NUM_FORMIGAS = 20
+NUM_ITERACOES = 50
+TAXA_EVAPORACAO = 0.5 # taxa de evaporação do feromônio
+PESO_FEROMONIO = 1.0 # alfa
+PESO_HEURISTICA = 2.0 # beta, peso da heurística (inverso da distância)
+NUM_CANDIDATOS = 15 # tamanho da lista de vizinhos mais próximos
+BUSCA_LOCAL = True # aplica 2-opt/Or-opt nas rotas construídas
+
+NOME_ARQUIVO = 'cidades_100.tsp'
+NUM_CIDADES_GERACAO = 100
+
+def main():
+    carregar_configuracao = input("Deseja carregar uma configuração existente? (S/N): ").lower() == "s"
+
+    if carregar_configuracao and not os.path.exists(NOME_ARQUIVO):
+        print("Não existe nenhuma configuração salva. Gerando nova configuração...")
+        carregar_configuracao = False
+
+    if carregar_configuracao:
+        print(f"Carregando configuração existente em {NOME_ARQUIVO}")
+        dist, coordenadas = carregar_tsplib(NOME_ARQUIVO)
+    else:
+        print(f"Gerando cidades aleatórias e salvando em {NOME_ARQUIVO}")
+        coordenadas = gerar_cidades_aleatorias(NUM_CIDADES_GERACAO)
+        salvar_tsplib(coordenadas, NOME_ARQUIVO)
+        dist = matriz_distancias(coordenadas)
+
+    print("Iniciando ...")
+    start_time = time.time()
+    with PERFIL.sessao("perfil_ant_system_tsp"):
+        melhor_rota, custo_melhor_rota = ant_system(dist)
+    print(f"Tempo execução: {time.time() - start_time}")
+
+    print(f"Melhor rota: {melhor_rota.tolist()}")
+    print(f"Comprimento melhor rota: {custo_melhor_rota}")
+    if coordenadas is not None:
+        plotar_rota(melhor_rota, coordenadas, custo_melhor_rota)
+
+def calcular_heuristica(dist: np.ndarray) -> np.ndarray:
+    """Calcula a matriz η^β, com η = 1 / distância
+
+    Args:
+        dist (np.ndarray): Matriz de distâncias
+
+    Returns:
+        np.ndarray: Matriz da heurística elevada ao peso β (zero na diagonal)
+    """
+    eta = np.zeros_like(dist, dtype=float)
+    np.divide(1.0, dist, out=eta, where=dist > 0)
+    eta[(dist == 0)] = eta.max() if eta.any() else 1.0
+    np.fill_diagonal(eta, 0.0)
+    return eta ** PESO_HEURISTICA
+
+def construir_rotas(peso: np.ndarray, candidatos: np.ndarray, num_formigas: int) -> np.ndarray:
+    """Constrói as rotas de todas as formigas ao mesmo tempo, um passo por vez.
+
+    Cada formiga escolhe a próxima cidade por roleta entre os candidatos ainda
+    não visitados da cidade atual, com probabilidade proporcional a τ^α·η^β.
+    Se todos os candidatos já foram visitados, a formiga vai para a cidade não
+    visitada de maior τ^α·η^β.
+
+    Args:
+        peso (np.ndarray): Matriz τ^α·η^β
+        candidatos (np.ndarray): Listas de candidatos de cada cidade (n × k)
+        num_formigas (int): Número de formigas
+
+    Returns:
+        np.ndarray: Array (num_formigas × n) com a rota de cada formiga
+    """
+    n = len(peso)
+    formigas = np.arange(num_formigas)
+    rotas = np.empty((num_formigas, n), dtype=np.intp)
+    visitados = np.zeros((num_formigas, n), dtype=bool)
+
+    atual = np.random.randint(0, n, size=num_formigas)
+    rotas[:, 0] = atual
+    visitados[formigas, atual] = True
+
+    for passo in range(1, n):
+        cand = candidatos[atual]
+        probabilidades = peso[atual[:, None], cand]
+        probabilidades[visitados[formigas[:, None], cand]] = 0.0
+        acumulado = np.cumsum(probabilidades, axis=1)
+        total = acumulado[:, -1]
+
+        proximo = np.empty(num_formigas, dtype=np.intp)
+        com_candidato = total > 0
+        if com_candidato.any():
+            sorteio = np.random.random(com_candidato.sum()) * total[com_candidato]
+            escolha = (acumulado[com_candidato] <= sorteio[:, None]).sum(axis=1)
+            proximo[com_candidato] = cand[com_candidato, escolha]
+
+        sem_candidato = ~com_candidato
+        if sem_candidato.any():
+            PERFIL.contar("passos_fora_candidatos", int(sem_candidato.sum()))
+            linhas = np.where(visitados[sem_candidato], -1.0, peso[atual[sem_candidato]])
+            proximo[sem_candidato] = linhas.argmax(axis=1)
+
+        rotas[:, passo] = proximo
+        visitados[formigas, proximo] = True
+        atual = proximo
+
+    return rotas
+
+def atualizar_feromonios(feromonios: np.ndarray, rotas: np.ndarray, custos: np.ndarray) -> np.ndarray:
+    """Aplica evaporação e adiciona os feromônios depositados pelas formigas
+
+    Args:
+        feromonios (np.ndarray): Matriz dos feromônios atuais
+        rotas (np.ndarray): Rotas das formigas (uma por linha)
+        custos (np.ndarray): Comprimento da rota de cada formiga
+
+    Returns:
+        np.ndarray: Nova matriz de feromônios
+    """
+    feromonios *= (1.0 - TAXA_EVAPORACAO)
+    origens = rotas.ravel()
+    destinos = np.roll(rotas, -1, axis=1).ravel()
+    depositos = np.repeat(1.0 / custos, rotas.shape[1])
+    np.add.at(feromonios, (origens, destinos), depositos)
+    np.add.at(feromonios, (destinos, origens), depositos)
+    return feromonios
+
+def ant_system(dist: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Executa o algoritmo do Ant System para o caixeiro viajante.
+
+    Args:
+        dist (np.ndarray): Matriz de distâncias entre as cidades.
+
+    Returns:
+        Tuple[np.ndarray, float]: Tupla contendo a melhor rota encontrada e o seu comprimento.
+    """
+    num_cidades = len(dist)
+    heuristica = calcular_heuristica(dist)
+    candidatos = listas_candidatos(dist, NUM_CANDIDATOS)
+
+    # feromônio inicial m / C_nn, com C_nn o comprimento da rota do vizinho mais próximo
+    custo_vizinho = comprimento_rota(rota_vizinho_mais_proximo(dist), dist)
+    feromonios = np.full((num_cidades, num_cidades), NUM_FORMIGAS / custo_vizinho)
+
+    melhor_rota = np.arange(num_cidades)
+    custo_melhor_rota = float('inf')
+
+    for it in range(NUM_ITERACOES):
+        with PERFIL.fase("construir_rotas"):
+            peso = heuristica if PESO_FEROMONIO == 0 else feromonios ** PESO_FEROMONIO * heuristica
+            rotas = construir_rotas(peso, candidatos, NUM_FORMIGAS)
+
+        if BUSCA_LOCAL:
+            with PERFIL.fase("busca_local"):
+                for formiga in range(NUM_FORMIGAS):
+                    rotas[formiga] = busca_local(rotas[formiga], dist, candidatos)
+
+        custos = comprimentos_rotas(rotas, dist)
+        formiga = int(np.argmin(custos))
+        if custos[formiga] < custo_melhor_rota:
+            melhor_rota = rotas[formiga].copy()
+            custo_melhor_rota = float(custos[formiga])
+
+        with PERFIL.fase("atualizar_feromonios"):
+            feromonios = atualizar_feromonios(feromonios, rotas, custos)
+
+        print(f"Iteração {it}: Custo melhor solução = {custo_melhor_rota};")
+
+    return melhor_rota, custo_melhor_rota
+
+if __name__ == '__main__':
+    main()
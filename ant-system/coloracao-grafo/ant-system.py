@@ -2,9 +2,13 @@ import random
 import networkx as nx
 import matplotlib.pyplot as plt
 import os
+import sys
 from typing import List, Tuple
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+from comum.perfil import PERFIL
+
 # Parâmetros do Ant System
 NUM_FORMIGAS = 10
 NUM_ITERACOES = 15
@@ -49,7 +53,8 @@ def main():
         
     print("Iniciando ...")
     start_time = time.time()
-    melhor_solucao, custo_melhor_solucao = ant_system(matriz_adjacencia)
+    with PERFIL.sessao("perfil_ant_system"):
+        melhor_solucao, custo_melhor_solucao = ant_system(matriz_adjacencia)
     print(f"Tempo execução: {time.time() - start_time}")
     
     print(f"Melhor solução: {melhor_solucao}")
@@ -164,7 +169,8 @@ def ant_system(matriz_adjacencia: List[List[bool]]) -> Tuple[List[int], int]:
             visitados = [vertice_atual]
             
             while len(visitados) < num_vertices:
-                proximo_vertice = escolher_proximo(vertice_atual, cor, solucoes[formiga], feromonios, matriz_adjacencia)
+                with PERFIL.fase("escolher_proximo"):
+                    proximo_vertice = escolher_proximo(vertice_atual, cor, solucoes[formiga], feromonios, matriz_adjacencia)
                 if proximo_vertice is not None:
                     visitados.append(proximo_vertice)
                     solucoes[formiga][proximo_vertice] = cor
@@ -172,20 +178,23 @@ def ant_system(matriz_adjacencia: List[List[bool]]) -> Tuple[List[int], int]:
                     vertice_atual = proximo_vertice
                 else:
                     cor += 1
+                    PERFIL.contar("novas_cores")
 
             custos[formiga] = cor + 1
 
             delta_feromonio = 1 / float(custos[formiga])
             caminho = zip(visitados[:-1], visitados[1:])
-            for i, j in caminho:
-                delta_feromonios[i][j] += delta_feromonio
-                delta_feromonios[j][i] = delta_feromonios[i][j]
+            with PERFIL.fase("depositar_feromonios"):
+                for i, j in caminho:
+                    delta_feromonios[i][j] += delta_feromonio
+                    delta_feromonios[j][i] = delta_feromonios[i][j]
             
             if custos[formiga] < custo_melhor_solucao:
                 melhor_solucao = solucoes[formiga][:]
                 custo_melhor_solucao = custos[formiga]
         
-        feromonios = atualizar_feromonios(feromonios, delta_feromonios)
+        with PERFIL.fase("atualizar_feromonios"):
+            feromonios = atualizar_feromonios(feromonios, delta_feromonios)
         
         print(f"Iteração {it}: Custo melhor solução = {custo_melhor_solucao};")
 
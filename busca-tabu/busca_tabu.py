@@ -1,6 +1,11 @@
+import os
+import sys
 import random
 from typing import List, Tuple
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from comum.perfil import PERFIL
+
 """
 Implementação da técnica de busca tabu para o problema da mochila.
 
@@ -94,14 +99,19 @@ def encontrar_melhor_vizinho(vizinhanca: List[List[int]], tabu: List[List[int]],
     Returns:
         Uma tupla contendo a melhor solução vizinha encontrada e o valor dessa solução.
     """
+    with PERFIL.fase("consulta_tabu"):
+        permitidos = [vizinho for vizinho in vizinhanca if vizinho not in tabu]
+    PERFIL.contar("acertos_tabu", len(vizinhanca) - len(permitidos))
+
     melhor_vizinho = None
     valor_melhor_vizinho = -1
-    for vizinho in vizinhanca:
-        if vizinho not in tabu:
+    with PERFIL.fase("avaliacao"):
+        for vizinho in permitidos:
             valor_vizinho = calcular_qualidade_solucao(vizinho, pesos, valores, capacidade)
             if valor_vizinho > valor_melhor_vizinho:
                 melhor_vizinho = vizinho
                 valor_melhor_vizinho = valor_vizinho
+    PERFIL.contar("avaliacoes", len(permitidos))
     return melhor_vizinho, valor_melhor_vizinho
 
 
@@ -130,7 +140,9 @@ def busca_tabu(pesos: List[float], valores: List[float], capacidade: float, max_
     iter_sem_melhora = 0
     i = 0
     while iter_sem_melhora < max_iter:
-        melhor_vizinho, valor_melhor_vizinho = encontrar_melhor_vizinho(gerar_vizinhanca(atual), tabu, pesos, valores, capacidade)
+        with PERFIL.fase("gerar_vizinhanca"):
+            vizinhanca = gerar_vizinhanca(atual)
+        melhor_vizinho, valor_melhor_vizinho = encontrar_melhor_vizinho(vizinhanca, tabu, pesos, valores, capacidade)
         log(f"Melhor vizinho (iter {i}): {melhor_vizinho, valor_melhor_vizinho}")
 
         if melhor_vizinho is None:
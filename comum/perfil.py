@@ -0,0 +1,194 @@
+import os
+import json
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+"""
+Instrumentação leve para os laços principais dos algoritmos.
+
+Quando desabilitado, `fase` devolve um contexto nulo compartilhado e `contar`
+retorna imediatamente, de forma que o custo nos laços críticos é praticamente
+zero. Quando habilitado, o tempo de cada fase e os contadores são agregados por
+nome e podem ser exportados em JSON.
+
+O perfilador global `PERFIL` é habilitado pela variável de ambiente PERFIL=1.
+A variável PERFIL_SESSAO=cprofile|pyinstrument faz com que `sessao` também
+grave um perfil completo da execução.
+"""
+
+
+class _ContextoNulo:
+    """Contexto que não faz nada, usado quando o perfilador está desabilitado"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULO = _ContextoNulo()
+
+
+class _Cronometro:
+    """Contexto que acumula o tempo gasto em uma fase do perfilador"""
+
+    __slots__ = ("perfilador", "nome", "inicio")
+
+    def __init__(self, perfilador: 'Perfilador', nome: str):
+        self.perfilador = perfilador
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.perfilador.registrar_tempo(self.nome, time.perf_counter() - self.inicio)
+        return False
+
+
+class Perfilador:
+    """
+    Classe que agrega tempos por fase e contadores de eventos.
+
+    Args:
+        habilitado (bool): Se False, todas as operações são ignoradas
+
+    Attributes:
+        habilitado (bool): Se o perfilador está coletando dados
+        tempos (Dict[str, float]): Tempo total (s) gasto em cada fase
+        chamadas (Dict[str, int]): Número de vezes que cada fase foi executada
+        contadores (Dict[str, int]): Valor de cada contador
+    """
+
+    def __init__(self, habilitado: bool = False):
+        self.habilitado = habilitado
+        self.limpar()
+
+    def limpar(self):
+        """Descarta todos os dados coletados até o momento"""
+        self.tempos: Dict[str, float] = {}
+        self.chamadas: Dict[str, int] = {}
+        self.contadores: Dict[str, int] = {}
+
+    def fase(self, nome: str):
+        """
+        Cria um contexto que mede o tempo gasto em uma fase.
+
+        Args:
+            nome (str): Nome da fase
+
+        Returns:
+            Contexto para uso com `with`
+        """
+        if not self.habilitado:
+            return _NULO
+        return _Cronometro(self, nome)
+
+    def registrar_tempo(self, nome: str, segundos: float):
+        """Soma um intervalo de tempo ao total de uma fase"""
+        self.tempos[nome] = self.tempos.get(nome, 0.0) + segundos
+        self.chamadas[nome] = self.chamadas.get(nome, 0) + 1
+
+    def contar(self, nome: str, n: int = 1):
+        """
+        Incrementa um contador.
+
+        Args:
+            nome (str): Nome do contador
+            n (int): Valor a ser somado
+        """
+        if not self.habilitado:
+            return
+        self.contadores[nome] = self.contadores.get(nome, 0) + n
+
+    def mesclar(self, outro: 'Perfilador'):
+        """
+        Soma ao perfilador os dados coletados por outro, por exemplo em um
+        processo filho.
+
+        Args:
+            outro (Perfilador): Perfilador cujos tempos e contadores serão somados
+        """
+        for nome, segundos in outro.tempos.items():
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + segundos
+            self.chamadas[nome] = self.chamadas.get(nome, 0) + outro.chamadas[nome]
+        for nome, valor in outro.contadores.items():
+            self.contadores[nome] = self.contadores.get(nome, 0) + valor
+
+    def relatorio(self) -> dict:
+        """
+        Monta um dicionário com os dados coletados.
+
+        Returns:
+            dict: Fases (tempo total, chamadas e tempo médio) e contadores
+        """
+        fases = {}
+        for nome, total in sorted(self.tempos.items(), key=lambda item: -item[1]):
+            chamadas = self.chamadas[nome]
+            fases[nome] = {"total_s": total, "chamadas": chamadas, "media_s": total / chamadas}
+        return {"fases": fases, "contadores": dict(self.contadores)}
+
+    def exportar_json(self, arquivo: str) -> None:
+        """
+        Salva o relatório em um arquivo JSON.
+
+        Args:
+            arquivo (str): Caminho do arquivo de saída
+        """
+        with open(arquivo, 'w') as f:
+            json.dump(self.relatorio(), f, indent=2)
+
+    def imprimir(self) -> None:
+        """Imprime o relatório no console"""
+        relatorio = self.relatorio()
+        for nome, fase in relatorio["fases"].items():
+            print(f"{nome:<30} {fase['total_s']:10.4f}s {fase['chamadas']:>10} chamadas")
+        for nome, valor in relatorio["contadores"].items():
+            print(f"{nome:<30} {valor:>10}")
+
+    @contextmanager
+    def sessao(self, arquivo: str, tipo: Optional[str] = None):
+        """
+        Executa o bloco sob um perfilador completo (cProfile ou pyinstrument) e,
+        se o perfilador estiver habilitado, exporta o relatório por fase em JSON.
+
+        Args:
+            arquivo (str): Prefixo dos arquivos de saída (sem extensão)
+            tipo (str): "cprofile", "pyinstrument" ou None. Se None, usa a
+                variável de ambiente PERFIL_SESSAO.
+        """
+        tipo = tipo if tipo is not None else os.environ.get("PERFIL_SESSAO")
+        if not self.habilitado:
+            tipo = None
+
+        if tipo == "cprofile":
+            import cProfile
+            perfilador = cProfile.Profile()
+            perfilador.enable()
+        elif tipo == "pyinstrument":
+            from pyinstrument import Profiler
+            perfilador = Profiler()
+            perfilador.start()
+        elif tipo is not None:
+            raise ValueError(f"Tipo de sessão desconhecido: {tipo}")
+
+        try:
+            yield self
+        finally:
+            if tipo == "cprofile":
+                perfilador.disable()
+                perfilador.dump_stats(f"{arquivo}.prof")
+            elif tipo == "pyinstrument":
+                perfilador.stop()
+                with open(f"{arquivo}.html", 'w') as f:
+                    f.write(perfilador.output_html())
+
+            if self.habilitado:
+                self.exportar_json(f"{arquivo}.json")
+                self.imprimir()
+
+
+PERFIL = Perfilador(habilitado=os.environ.get("PERFIL", "0") not in ("", "0"))
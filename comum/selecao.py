@@ -0,0 +1,49 @@
+from typing import Optional
+
+import numpy as np
+
+"""
+Esquemas de seleção compartilhados pelos algoritmos genéticos.
+
+Ambas as funções recebem o fitness da população como um array (maior é melhor)
+e devolvem índices, de forma que servem tanto para populações guardadas em
+listas de objetos quanto para populações guardadas em um único array.
+"""
+
+
+def torneio(fitness: np.ndarray, num_selecionados: int, tamanho: int = 2) -> np.ndarray:
+    """
+    Seleciona indivíduos por torneio, todos os torneios de uma vez.
+
+    Args:
+        fitness (np.ndarray): Fitness de cada indivíduo
+        num_selecionados (int): Número de indivíduos a selecionar
+        tamanho (int): Número de competidores em cada torneio
+
+    Returns:
+        np.ndarray: Índices dos vencedores
+    """
+    fitness = np.asarray(fitness)
+    competidores = np.random.randint(0, len(fitness), size=(num_selecionados, tamanho))
+    vencedores = np.argmax(fitness[competidores], axis=1)
+    return competidores[np.arange(num_selecionados), vencedores]
+
+
+def selecionar_sobreviventes(fitness: np.ndarray, n_sobreviventes: int, n_elite: Optional[int] = None) -> np.ndarray:
+    """
+    Seleciona os sobreviventes por elitismo: os `n_elite` melhores são mantidos
+    e o restante é sorteado entre os demais.
+
+    Args:
+        fitness (np.ndarray): Fitness de cada indivíduo
+        n_sobreviventes (int): Número de indivíduos que sobrevivem
+        n_elite (int): Número de melhores mantidos. Se None, metade dos sobreviventes.
+
+    Returns:
+        np.ndarray: Índices dos sobreviventes, com a elite primeiro e em ordem decrescente de fitness
+    """
+    if n_elite is None:
+        n_elite = n_sobreviventes // 2
+    ordem = np.argsort(-np.asarray(fitness), kind='stable')
+    sorteados = np.random.choice(ordem[n_elite:], n_sobreviventes - n_elite, replace=False)
+    return np.concatenate([ordem[:n_elite], sorteados])
@@ -0,0 +1,417 @@
+from collections import deque
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+"""
+Funções auxiliares para o problema do caixeiro viajante (TSP).
+
+Reúne a leitura e escrita de instâncias no formato TSPLIB, o cálculo da matriz
+de distâncias, as listas de candidatos (vizinhos mais próximos), a avaliação de
+rotas e a busca local 2-opt/Or-opt, compartilhadas pelas implementações de TSP
+dos diferentes algoritmos.
+
+Uma rota é representada por uma permutação das cidades (0..n-1); a volta da
+última cidade para a primeira está implícita.
+"""
+
+RAIO_TERRA = 6378.388
+
+
+def _geo_para_radianos(valor: np.ndarray) -> np.ndarray:
+    """Converte coordenadas no formato GEO (DDD.MM) do TSPLIB para radianos"""
+    graus = np.trunc(valor)
+    minutos = valor - graus
+    return np.pi * (graus + 5.0 * minutos / 3.0) / 180.0
+
+
+def matriz_distancias(coordenadas: np.ndarray, tipo: str = "EUC_2D") -> np.ndarray:
+    """
+    Calcula a matriz de distâncias entre todas as cidades.
+
+    Args:
+        coordenadas (np.ndarray): Array (n × 2) com as coordenadas das cidades
+        tipo (str): Tipo de distância do TSPLIB (EUC_2D, CEIL_2D, ATT, GEO ou
+            REAL para a distância euclidiana sem arredondamento)
+
+    Returns:
+        np.ndarray: Matriz (n × n) de distâncias
+    """
+    coordenadas = np.asarray(coordenadas, dtype=float)
+    if tipo == "GEO":
+        latitude = _geo_para_radianos(coordenadas[:, 0])
+        longitude = _geo_para_radianos(coordenadas[:, 1])
+        q1 = np.cos(longitude[:, None] - longitude[None, :])
+        q2 = np.cos(latitude[:, None] - latitude[None, :])
+        q3 = np.cos(latitude[:, None] + latitude[None, :])
+        argumento = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+        dist = np.floor(RAIO_TERRA * np.arccos(argumento) + 1.0)
+        np.fill_diagonal(dist, 0.0)
+        return dist
+
+    diferenca = coordenadas[:, None, :] - coordenadas[None, :, :]
+    quadrado = np.einsum('ijk,ijk->ij', diferenca, diferenca)
+    if tipo == "ATT":
+        r = np.sqrt(quadrado / 10.0)
+        t = np.rint(r)
+        return np.where(t < r, t + 1.0, t)
+
+    dist = np.sqrt(quadrado)
+    if tipo == "EUC_2D":
+        return np.floor(dist + 0.5)
+    if tipo == "CEIL_2D":
+        return np.ceil(dist)
+    if tipo == "REAL":
+        return dist
+    raise ValueError(f"Tipo de distância não suportado: {tipo}")
+
+
+def _matriz_explicita(valores: List[float], n: int, formato: str) -> np.ndarray:
+    """Monta a matriz de distâncias a partir de uma seção EDGE_WEIGHT_SECTION"""
+    dist = np.zeros((n, n))
+    if formato == "FULL_MATRIX":
+        return np.array(valores[:n * n], dtype=float).reshape(n, n)
+
+    if formato in ("UPPER_ROW", "LOWER_COL"):
+        indices = np.triu_indices(n, k=1)
+    elif formato in ("LOWER_ROW", "UPPER_COL"):
+        indices = np.tril_indices(n, k=-1)
+    elif formato in ("UPPER_DIAG_ROW", "LOWER_DIAG_COL"):
+        indices = np.triu_indices(n)
+    elif formato in ("LOWER_DIAG_ROW", "UPPER_DIAG_COL"):
+        indices = np.tril_indices(n)
+    else:
+        raise ValueError(f"Formato de matriz não suportado: {formato}")
+
+    dist[indices] = valores[:len(indices[0])]
+    return np.maximum(dist, dist.T)
+
+
+def carregar_tsplib(arquivo: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Carrega uma instância do TSP no formato TSPLIB.
+
+    São suportadas instâncias com NODE_COORD_SECTION (EUC_2D, CEIL_2D, ATT e
+    GEO) e com EDGE_WEIGHT_SECTION (EXPLICIT, nos formatos de matriz usuais).
+
+    Args:
+        arquivo (str): Caminho do arquivo .tsp
+
+    Returns:
+        Tuple[np.ndarray, Optional[np.ndarray]]: Matriz de distâncias e
+        coordenadas das cidades (None se a instância não possuir coordenadas)
+    """
+    cabecalho = {}
+    coordenadas = []
+    pesos = []
+    secao = None
+
+    with open(arquivo, 'r') as f:
+        for linha in f:
+            linha = linha.strip()
+            if not linha or linha == "EOF":
+                continue
+
+            if linha.split(":")[0].strip().endswith("_SECTION"):
+                secao = linha.split(":")[0].strip()
+                continue
+
+            if secao is None and ":" in linha:
+                chave, valor = linha.split(":", 1)
+                cabecalho[chave.strip()] = valor.strip()
+                continue
+
+            if secao == "NODE_COORD_SECTION":
+                _, x, y = linha.split()[:3]
+                coordenadas.append((float(x), float(y)))
+            elif secao == "EDGE_WEIGHT_SECTION":
+                pesos.extend(float(v) for v in linha.split())
+
+    n = int(cabecalho["DIMENSION"])
+    tipo = cabecalho.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+
+    if tipo == "EXPLICIT":
+        dist = _matriz_explicita(pesos, n, cabecalho.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX"))
+        coords = np.array(coordenadas[:n]) if coordenadas else None
+        return dist, coords
+
+    coords = np.array(coordenadas[:n])
+    return matriz_distancias(coords, tipo), coords
+
+
+def salvar_tsplib(coordenadas: np.ndarray, arquivo: str, nome: str = "aleatorio") -> None:
+    """
+    Salva as coordenadas das cidades em um arquivo no formato TSPLIB (EUC_2D).
+
+    Args:
+        coordenadas (np.ndarray): Array (n × 2) com as coordenadas das cidades
+        arquivo (str): Caminho do arquivo de saída
+        nome (str): Nome da instância
+    """
+    with open(arquivo, 'w') as f:
+        f.write(f"NAME : {nome}\n")
+        f.write("TYPE : TSP\n")
+        f.write(f"DIMENSION : {len(coordenadas)}\n")
+        f.write("EDGE_WEIGHT_TYPE : EUC_2D\n")
+        f.write("NODE_COORD_SECTION\n")
+        for i, (x, y) in enumerate(coordenadas):
+            f.write(f"{i + 1} {x:g} {y:g}\n")
+        f.write("EOF\n")
+
+
+def gerar_cidades_aleatorias(n: int, tamanho: float = 1000.0) -> np.ndarray:
+    """
+    Gera cidades com coordenadas inteiras aleatórias em um quadrado.
+
+    Args:
+        n (int): Número de cidades
+        tamanho (float): Lado do quadrado
+
+    Returns:
+        np.ndarray: Array (n × 2) com as coordenadas das cidades
+    """
+    return np.random.randint(0, int(tamanho) + 1, size=(n, 2)).astype(float)
+
+
+def listas_candidatos(dist: np.ndarray, k: int) -> np.ndarray:
+    """
+    Calcula a lista dos k vizinhos mais próximos de cada cidade.
+
+    Args:
+        dist (np.ndarray): Matriz de distâncias
+        k (int): Tamanho da lista de candidatos
+
+    Returns:
+        np.ndarray: Array (n × k) com os vizinhos de cada cidade, ordenados pela distância
+    """
+    n = len(dist)
+    k = min(k, n - 1)
+    d = dist.astype(float, copy=True)
+    np.fill_diagonal(d, np.inf)
+    candidatos = np.argpartition(d, k - 1, axis=1)[:, :k]
+    ordem = np.argsort(np.take_along_axis(d, candidatos, axis=1), axis=1)
+    return np.take_along_axis(candidatos, ordem, axis=1)
+
+
+def comprimento_rota(rota, dist: np.ndarray) -> float:
+    """
+    Calcula o comprimento de uma rota fechada.
+
+    Args:
+        rota: Permutação das cidades
+        dist (np.ndarray): Matriz de distâncias
+
+    Returns:
+        float: Comprimento da rota
+    """
+    rota = np.asarray(rota)
+    return float(dist[rota, np.roll(rota, -1)].sum())
+
+
+def comprimentos_rotas(rotas: np.ndarray, dist: np.ndarray) -> np.ndarray:
+    """
+    Calcula o comprimento de várias rotas de uma vez.
+
+    Args:
+        rotas (np.ndarray): Array (m × n) com uma rota por linha
+        dist (np.ndarray): Matriz de distâncias
+
+    Returns:
+        np.ndarray: Array (m) com o comprimento de cada rota
+    """
+    return dist[rotas, np.roll(rotas, -1, axis=1)].sum(axis=1)
+
+
+def rota_vizinho_mais_proximo(dist: np.ndarray, inicio: int = 0) -> np.ndarray:
+    """
+    Constrói uma rota pela heurística do vizinho mais próximo.
+
+    Args:
+        dist (np.ndarray): Matriz de distâncias
+        inicio (int): Cidade inicial
+
+    Returns:
+        np.ndarray: Rota construída
+    """
+    n = len(dist)
+    rota = np.empty(n, dtype=np.intp)
+    visitado = np.zeros(n, dtype=bool)
+    atual = inicio
+    for passo in range(n):
+        rota[passo] = atual
+        visitado[atual] = True
+        if passo < n - 1:
+            atual = int(np.argmin(np.where(visitado, np.inf, dist[atual])))
+    return rota
+
+
+def inverter_trecho(rota: List[int], pos: List[int], i: int, j: int):
+    """
+    Inverte o trecho cíclico rota[i..j], atualizando as posições. Se o trecho
+    for maior que metade da rota, inverte o complemento, que resulta na mesma
+    rota percorrida no sentido contrário.
+
+    Args:
+        rota (List[int]): Rota, alterada no lugar
+        pos (List[int]): Posição de cada cidade na rota, alterada no lugar
+        i (int): Posição inicial do trecho
+        j (int): Posição final do trecho
+    """
+    n = len(rota)
+    tam = (j - i) % n + 1
+    if 2 * tam > n:
+        i, j = (j + 1) % n, (i - 1) % n
+        tam = n - tam
+    for _ in range(tam // 2):
+        a, b = rota[i], rota[j]
+        rota[i], pos[b] = b, i
+        rota[j], pos[a] = a, j
+        i = (i + 1) % n
+        j = (j - 1) % n
+
+
+def _dois_opt(a: int, rota: List[int], pos: List[int], d, candidatos: List[List[int]]) -> Optional[Tuple[int, ...]]:
+    """
+    Procura um movimento 2-opt de melhora que cria uma aresta entre `a` e um de
+    seus candidatos. Aplica o primeiro encontrado.
+
+    Returns:
+        Cidades cujas arestas foram alteradas, ou None se não houve melhora
+    """
+    n = len(rota)
+    for sentido in (1, -1):
+        b = rota[(pos[a] + sentido) % n]
+        d_ab = d(a, b)
+        for c in candidatos[a]:
+            d_ac = d(a, c)
+            if d_ac >= d_ab:
+                break
+            e = rota[(pos[c] + sentido) % n]
+            if c == b or e == a:
+                continue
+            delta = d_ac + d(b, e) - d_ab - d(c, e)
+            if delta < -1e-9:
+                if sentido == 1:
+                    inverter_trecho(rota, pos, pos[b], pos[c])
+                else:
+                    inverter_trecho(rota, pos, pos[c], pos[b])
+                return a, b, c, e
+    return None
+
+
+def _or_opt(a: int, rota: List[int], pos: List[int], d, candidatos: List[List[int]]) -> Optional[Tuple[int, ...]]:
+    """
+    Procura um movimento Or-opt de melhora que move um segmento de 1 a 3
+    cidades iniciado em `a` para junto de um candidato de `a`, mantendo ou
+    invertendo o sentido do segmento. Aplica o primeiro encontrado.
+
+    Returns:
+        Cidades cujas arestas foram alteradas, ou None se não houve melhora
+    """
+    n = len(rota)
+    if n < 8:
+        return None
+    i = pos[a]
+    p = rota[(i - 1) % n]
+    for tam in (1, 2, 3):
+        segmento = [rota[(i + t) % n] for t in range(tam)]
+        e = segmento[-1]
+        s = rota[(i + tam) % n]
+        ganho_remocao = d(p, a) + d(e, s) - d(p, s)
+        if ganho_remocao <= 1e-9:
+            continue
+        for c in candidatos[a]:
+            if c in segmento:
+                continue
+            for f in (rota[(pos[c] + 1) % n], rota[(pos[c] - 1) % n]):
+                if f in segmento:
+                    continue
+                # c-a...e-f: o segmento entra com `a` ligado a `c`
+                delta = d(c, a) + d(e, f) - d(c, f) - ganho_remocao
+                if delta < -1e-9:
+                    _mover_segmento(rota, pos, segmento, c, f)
+                    return p, a, e, s, c, f
+    return None
+
+
+def _mover_segmento(rota: List[int], pos: List[int], segmento: List[int], c: int, f: int):
+    """Remove o segmento da rota e o insere entre as cidades adjacentes c e f,
+    com o primeiro elemento do segmento ligado a c"""
+    n = len(rota)
+    inicio = pos[segmento[0]]
+    restante = rota[inicio:] + rota[:inicio]
+    restante = restante[len(segmento):]
+    k = restante.index(c)
+    if restante[(k + 1) % len(restante)] == f:
+        novo = restante[:k + 1] + segmento + restante[k + 1:]
+    else:
+        novo = restante[:k] + segmento[::-1] + restante[k:]
+    rota[:] = novo
+    for posicao in range(n):
+        pos[rota[posicao]] = posicao
+
+
+def busca_local(rota, dist: np.ndarray, candidatos: np.ndarray, or_opt: bool = True) -> np.ndarray:
+    """
+    Melhora uma rota com 2-opt e Or-opt restritos às listas de candidatos,
+    usando "don't look bits": apenas as cidades cujas arestas mudaram voltam a
+    ser examinadas.
+
+    Args:
+        rota: Rota inicial
+        dist (np.ndarray): Matriz de distâncias
+        candidatos (np.ndarray): Listas de candidatos, ordenadas pela distância
+        or_opt (bool): Se True, também aplica movimentos Or-opt
+
+    Returns:
+        np.ndarray: Rota localmente ótima
+    """
+    rota = [int(c) for c in rota]
+    n = len(rota)
+    if n < 5:
+        return np.array(rota, dtype=np.intp)
+
+    pos = [0] * n
+    for posicao, cidade in enumerate(rota):
+        pos[cidade] = posicao
+    candidatos = candidatos.tolist()
+    d = dist.item
+
+    fila = deque(rota)
+    na_fila = [True] * n
+    while fila:
+        a = fila.popleft()
+        na_fila[a] = False
+        alteradas = _dois_opt(a, rota, pos, d, candidatos)
+        if alteradas is None and or_opt:
+            alteradas = _or_opt(a, rota, pos, d, candidatos)
+        if alteradas is None:
+            continue
+        for cidade in alteradas:
+            if not na_fila[cidade]:
+                na_fila[cidade] = True
+                fila.append(cidade)
+
+    return np.array(rota, dtype=np.intp)
+
+
+def plotar_rota(rota: np.ndarray, coordenadas: np.ndarray, custo: float, arquivo: Optional[str] = None):
+    """
+    Plota as cidades e a rota que as percorre.
+
+    Args:
+        rota (np.ndarray): Ordem em que as cidades são visitadas
+        coordenadas (np.ndarray): Coordenadas (n × 2) das cidades
+        custo (float): Comprimento da rota, exibido no título
+        arquivo (str): Se informado, a figura também é salva neste arquivo
+    """
+    import matplotlib.pyplot as plt
+
+    caminho = coordenadas[np.append(rota, rota[0])]
+    plt.plot(caminho[:, 0], caminho[:, 1], '-', linewidth=1)
+    plt.plot(coordenadas[:, 0], coordenadas[:, 1], 'o', markersize=3)
+    plt.gca().set_aspect('equal')
+    plt.title(f"Comprimento: {custo:.0f}")
+    if arquivo is not None:
+        plt.savefig(arquivo)
+    plt.show()
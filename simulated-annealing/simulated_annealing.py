@@ -0,0 +1,436 @@
+import os
+import sys
+import math
+import random
+from multiprocessing import Pool
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from comum.perfil import PERFIL
+from comum.tsp import listas_candidatos, comprimento_rota, inverter_trecho
+
+"""
+Implementação da técnica de simulated annealing para o problema da mochila e
+para o problema do caixeiro viajante.
+
+Cada problema mantém uma única solução corrente e avalia os movimentos por
+diferença de custo (delta), sem copiar a solução: a inversão de um bit na
+mochila custa O(1) e um movimento 2-opt no TSP custa O(1) para avaliar (o
+trecho só é invertido quando o movimento é aceito). O custo é sempre
+minimizado; na mochila ele é o valor total com sinal negativo.
+
+Além da execução serial, várias cadeias em temperaturas diferentes podem ser
+executadas em paralelo em um pool de processos, com trocas opcionais de
+solução entre temperaturas vizinhas (parallel tempering).
+"""
+
+TEMPERATURA_MINIMA = 1e-9
+
+
+class Mochila:
+    """
+    Classe que representa o problema da mochila para o simulated annealing.
+
+    O movimento é a inversão de um item. Movimentos que ultrapassam a capacidade
+    recebem delta infinito e por isso nunca são aceitos, mantendo a solução viável.
+
+    Args:
+        pesos (List[int]): pesos dos itens.
+        valores (List[int]): valores dos itens.
+        capacidade (int): capacidade da mochila.
+
+    Attributes:
+        itens (List[int]): solução corrente (0 ou 1 para cada item)
+        peso_total (int): peso dos itens na mochila
+        custo (float): valor dos itens na mochila com sinal negativo
+    """
+
+    def __init__(self, pesos: List[float], valores: List[float], capacidade: float):
+        self.pesos = list(pesos)
+        self.valores = list(valores)
+        self.capacidade = capacidade
+        self.n = len(pesos)
+        self.restaurar([0] * self.n)
+
+    def propor(self) -> Tuple[float, int]:
+        """
+        Sorteia um item para ser invertido e calcula o delta do custo.
+
+        Returns:
+            Tuple[float, int]: delta do custo e item sorteado
+        """
+        i = int(random.random() * self.n)
+        if self.itens[i]:
+            return self.valores[i], i
+        if self.peso_total + self.pesos[i] > self.capacidade:
+            return math.inf, i
+        return -self.valores[i], i
+
+    def aplicar(self, i: int, delta: float):
+        """Inverte o item `i` na solução corrente"""
+        if self.itens[i]:
+            self.itens[i] = 0
+            self.peso_total -= self.pesos[i]
+        else:
+            self.itens[i] = 1
+            self.peso_total += self.pesos[i]
+        self.custo += delta
+
+    def estado(self) -> List[int]:
+        """Retorna uma cópia da solução corrente"""
+        return self.itens.copy()
+
+    def restaurar(self, estado: List[int]):
+        """Substitui a solução corrente, recalculando peso e custo"""
+        self.itens = list(estado)
+        self.peso_total = sum(p for p, x in zip(self.pesos, self.itens) if x)
+        self.custo = -sum(v for v, x in zip(self.valores, self.itens) if x)
+
+
+class CaixeiroViajante:
+    """
+    Classe que representa o problema do caixeiro viajante para o simulated annealing.
+
+    O movimento é um 2-opt que liga uma cidade sorteada a um de seus k vizinhos
+    mais próximos, avaliado em O(1) a partir das quatro arestas envolvidas.
+
+    Args:
+        dist (np.ndarray): matriz de distâncias.
+        num_candidatos (int): tamanho da lista de vizinhos mais próximos.
+        rota (List[int]): rota inicial. Se None, é sorteada.
+
+    Attributes:
+        rota (List[int]): rota corrente
+        pos (List[int]): posição de cada cidade na rota corrente
+        custo (float): comprimento da rota corrente
+    """
+
+    def __init__(self, dist: np.ndarray, num_candidatos: int = 10, rota: Optional[List[int]] = None):
+        self.dist = dist
+        self.n = len(dist)
+        self.candidatos = listas_candidatos(dist, num_candidatos).tolist()
+        self.k = len(self.candidatos[0])
+        self._d = dist.item
+        if rota is None:
+            rota = random.sample(range(self.n), self.n)
+        self.restaurar(rota)
+
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        del estado['_d']
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self._d = self.dist.item
+
+    def propor(self) -> Tuple[float, Tuple[int, int]]:
+        """
+        Sorteia um movimento 2-opt e calcula o delta do custo.
+
+        Returns:
+            Tuple[float, Tuple[int, int]]: delta do custo e trecho a ser invertido
+        """
+        n, rota, pos, d = self.n, self.rota, self.pos, self._d
+        a = int(random.random() * n)
+        c = self.candidatos[a][int(random.random() * self.k)]
+        i, j = (pos[a] + 1) % n, pos[c]
+        b = rota[i]
+        e = rota[(j + 1) % n]
+        if b == c or e == a:
+            return math.inf, (i, j)
+        return d(a, c) + d(b, e) - d(a, b) - d(c, e), (i, j)
+
+    def aplicar(self, trecho: Tuple[int, int], delta: float):
+        """Inverte o trecho da rota corrente"""
+        inverter_trecho(self.rota, self.pos, trecho[0], trecho[1])
+        self.custo += delta
+
+    def estado(self) -> List[int]:
+        """Retorna uma cópia da rota corrente"""
+        return self.rota.copy()
+
+    def restaurar(self, estado: List[int]):
+        """Substitui a rota corrente, recalculando posições e custo"""
+        self.rota = [int(c) for c in estado]
+        self.pos = [0] * self.n
+        for posicao, cidade in enumerate(self.rota):
+            self.pos[cidade] = posicao
+        self.custo = comprimento_rota(self.rota, self.dist)
+
+
+class ResfriamentoGeometrico:
+    """
+    Resfriamento geométrico: a temperatura é multiplicada por `alfa` a cada
+    `passos` movimentos.
+
+    Args:
+        alfa (float): fator de resfriamento
+        passos (int): número de movimentos em cada temperatura
+    """
+
+    def __init__(self, alfa: float = 0.95, passos: int = 1000):
+        self.alfa = alfa
+        self.passos = passos
+
+    def proxima(self, temperatura: float, taxa_aceitacao: float, melhorou: bool) -> float:
+        """
+        Calcula a próxima temperatura.
+
+        Args:
+            temperatura (float): temperatura atual
+            taxa_aceitacao (float): fração dos movimentos aceitos na temperatura atual
+            melhorou (bool): se a melhor solução melhorou na temperatura atual
+
+        Returns:
+            float: nova temperatura
+        """
+        return temperatura * self.alfa
+
+
+class ResfriamentoAdaptativo(ResfriamentoGeometrico):
+    """
+    Resfriamento guiado pela taxa de aceitação: a taxa alvo decai
+    geometricamente de `taxa_inicial` até `taxa_final` e a temperatura é
+    corrigida para acompanhá-la (resfria mais rápido quando aceita demais e
+    aquece quando aceita de menos).
+
+    Args:
+        taxa_inicial (float): taxa de aceitação alvo no início
+        taxa_final (float): menor taxa de aceitação alvo
+        decaimento (float): fator de decaimento da taxa alvo
+        ganho (float): intensidade da correção da temperatura
+        passos (int): número de movimentos em cada temperatura
+    """
+
+    def __init__(self, taxa_inicial: float = 0.5, taxa_final: float = 0.001, decaimento: float = 0.95,
+                 ganho: float = 2.0, passos: int = 1000):
+        super().__init__(decaimento, passos)
+        self.alvo = taxa_inicial
+        self.taxa_final = taxa_final
+        self.ganho = ganho
+
+    def proxima(self, temperatura: float, taxa_aceitacao: float, melhorou: bool) -> float:
+        self.alvo = max(self.taxa_final, self.alvo * self.alfa)
+        return temperatura * math.exp(self.ganho * (self.alvo - taxa_aceitacao))
+
+
+class ResfriamentoReaquecimento(ResfriamentoGeometrico):
+    """
+    Resfriamento geométrico com reaquecimento: se a melhor solução não melhora
+    por `paciencia` temperaturas seguidas, a temperatura volta para `fator`
+    vezes a temperatura em que houve a última melhora.
+
+    Args:
+        alfa (float): fator de resfriamento
+        paciencia (int): número de temperaturas sem melhora antes de reaquecer
+        fator (float): fração da temperatura da última melhora usada no reaquecimento
+        passos (int): número de movimentos em cada temperatura
+    """
+
+    def __init__(self, alfa: float = 0.95, paciencia: int = 20, fator: float = 0.5, passos: int = 1000):
+        super().__init__(alfa, passos)
+        self.paciencia = paciencia
+        self.fator = fator
+        self.sem_melhora = 0
+        self.temperatura_melhora = None
+
+    def proxima(self, temperatura: float, taxa_aceitacao: float, melhorou: bool) -> float:
+        if melhorou or self.temperatura_melhora is None:
+            self.temperatura_melhora = temperatura
+            self.sem_melhora = 0
+        else:
+            self.sem_melhora += 1
+
+        if self.sem_melhora >= self.paciencia:
+            self.sem_melhora = 0
+            PERFIL.contar("reaquecimentos")
+            return max(temperatura, self.fator * self.temperatura_melhora)
+        return temperatura * self.alfa
+
+
+def estimar_temperatura_inicial(problema, taxa_aceitacao: float = 0.8, amostras: int = 1000) -> float:
+    """
+    Estima a temperatura em que movimentos de piora são aceitos com a taxa dada,
+    a partir da média do módulo dos deltas de movimentos sorteados a partir da
+    solução corrente (o módulo permite a estimativa mesmo quando todos os
+    movimentos a partir dela são de melhora, como na mochila vazia).
+
+    Args:
+        problema: instância de Mochila ou CaixeiroViajante
+        taxa_aceitacao (float): taxa de aceitação desejada para movimentos de piora
+        amostras (int): número de movimentos sorteados
+
+    Returns:
+        float: temperatura inicial
+    """
+    deltas = [abs(delta) for delta, _ in (problema.propor() for _ in range(amostras)) if 0 < abs(delta) < math.inf]
+    if not deltas:
+        return 1.0
+    return -(sum(deltas) / len(deltas)) / math.log(taxa_aceitacao)
+
+
+def recozer(problema, temperatura: float, resfriamento: ResfriamentoGeometrico,
+            num_passos: int) -> Tuple[list, float, float]:
+    """
+    Executa movimentos de simulated annealing a partir da solução corrente do problema.
+
+    A melhor solução só é copiada quando a cadeia está prestes a sair dela por um
+    movimento de piora, de forma que sequências de melhoras não custam cópias.
+
+    Args:
+        problema: instância de Mochila ou CaixeiroViajante
+        temperatura (float): temperatura inicial
+        resfriamento (ResfriamentoGeometrico): esquema de resfriamento
+        num_passos (int): número total de movimentos
+
+    Returns:
+        Tuple[list, float, float]: melhor solução, custo da melhor solução e temperatura final
+    """
+    propor = problema.propor
+    aplicar = problema.aplicar
+    aleatorio = random.random
+    exp = math.exp
+
+    melhor = problema.estado()
+    custo_melhor = problema.custo
+    melhor_pendente = False
+    melhorou = False
+
+    passos_temperatura = resfriamento.passos
+    restantes = num_passos
+    while restantes > 0:
+        passos = min(passos_temperatura, restantes)
+        restantes -= passos
+        aceitos = 0
+
+        with PERFIL.fase("movimentos"):
+            for _ in range(passos):
+                delta, movimento = propor()
+                if delta <= 0:
+                    aplicar(movimento, delta)
+                    aceitos += 1
+                    if problema.custo < custo_melhor:
+                        custo_melhor = problema.custo
+                        melhor_pendente = True
+                        melhorou = True
+                elif aleatorio() < exp(-delta / temperatura):
+                    if melhor_pendente:
+                        melhor = problema.estado()
+                        melhor_pendente = False
+                    aplicar(movimento, delta)
+                    aceitos += 1
+
+        PERFIL.contar("movimentos", passos)
+        PERFIL.contar("aceitos", aceitos)
+        temperatura = max(TEMPERATURA_MINIMA, resfriamento.proxima(temperatura, aceitos / passos, melhorou))
+        melhorou = False
+
+    if melhor_pendente:
+        melhor = problema.estado()
+    return melhor, custo_melhor, temperatura
+
+
+def simulated_annealing(problema, max_iter: int, resfriamento: Optional[ResfriamentoGeometrico] = None,
+                        temperatura_inicial: Optional[float] = None) -> Tuple[list, float]:
+    """
+    Executa o simulated annealing em uma única cadeia.
+
+    Args:
+        problema: instância de Mochila ou CaixeiroViajante
+        max_iter (int): número total de movimentos
+        resfriamento (ResfriamentoGeometrico): esquema de resfriamento. Se None, usa o geométrico.
+        temperatura_inicial (float): temperatura inicial. Se None, é estimada.
+
+    Returns:
+        Uma tupla contendo a melhor solução encontrada e o seu custo.
+    """
+    if resfriamento is None:
+        resfriamento = ResfriamentoGeometrico()
+    if temperatura_inicial is None:
+        temperatura_inicial = estimar_temperatura_inicial(problema)
+    melhor, custo_melhor, _ = recozer(problema, temperatura_inicial, resfriamento, max_iter)
+    return melhor, custo_melhor
+
+
+_PROBLEMA = None
+
+
+def _inicializar_processo(problema):
+    """Guarda a instância do problema no processo, para não reenviá-la a cada rodada"""
+    global _PROBLEMA
+    _PROBLEMA = problema
+
+
+def _executar_rodada(argumentos):
+    """
+    Executa uma rodada de uma cadeia em um processo do pool.
+
+    Os dados do perfilador do processo são devolvidos junto com o resultado
+    (ou None, se estiver desabilitado), para que o processo pai os agregue.
+    """
+    estado, temperatura, resfriamento, num_passos, semente = argumentos
+    random.seed(semente)
+    PERFIL.limpar()
+    _PROBLEMA.restaurar(estado)
+    melhor, custo_melhor, temperatura = recozer(_PROBLEMA, temperatura, resfriamento, num_passos)
+    perfil = PERFIL if PERFIL.habilitado else None
+    return _PROBLEMA.estado(), _PROBLEMA.custo, melhor, custo_melhor, temperatura, resfriamento, perfil
+
+
+def cadeias_paralelas(problema, temperaturas: List[float], resfriamentos: List[ResfriamentoGeometrico],
+                      num_passos: int, num_rodadas: int = 1, trocas: bool = False,
+                      processos: Optional[int] = None) -> Tuple[list, float]:
+    """
+    Executa várias cadeias de simulated annealing em paralelo em um pool de processos.
+
+    As cadeias avançam em rodadas de `num_passos` movimentos. Com `trocas`
+    habilitado, ao fim de cada rodada cadeias em temperaturas vizinhas trocam de
+    solução com probabilidade min(1, exp((1/Ti - 1/Tj)(Ei - Ej))) (parallel tempering).
+
+    Args:
+        problema: instância de Mochila ou CaixeiroViajante, usada como solução inicial de todas as cadeias
+        temperaturas (List[float]): temperatura inicial de cada cadeia
+        resfriamentos (List[ResfriamentoGeometrico]): esquema de resfriamento de cada cadeia
+        num_passos (int): número de movimentos de cada cadeia por rodada
+        num_rodadas (int): número de rodadas
+        trocas (bool): se True, aplica trocas de parallel tempering entre as rodadas
+        processos (int): número de processos do pool. Se None, usa o número de CPUs.
+
+    Returns:
+        Uma tupla contendo a melhor solução encontrada e o seu custo.
+    """
+    num_cadeias = len(temperaturas)
+    temperaturas = list(temperaturas)
+    resfriamentos = list(resfriamentos)
+    estados = [problema.estado() for _ in range(num_cadeias)]
+    custos = [problema.custo] * num_cadeias
+
+    melhor = problema.estado()
+    custo_melhor = problema.custo
+
+    with Pool(processos, initializer=_inicializar_processo, initargs=(problema,)) as pool:
+        for rodada in range(num_rodadas):
+            tarefas = [(estados[c], temperaturas[c], resfriamentos[c], num_passos, random.getrandbits(32))
+                       for c in range(num_cadeias)]
+            for c, resultado in enumerate(pool.map(_executar_rodada, tarefas)):
+                estados[c], custos[c], melhor_cadeia, custo_cadeia, temperaturas[c], resfriamentos[c], perfil = resultado
+                if perfil is not None:
+                    PERFIL.mesclar(perfil)
+                if custo_cadeia < custo_melhor:
+                    melhor, custo_melhor = melhor_cadeia, custo_cadeia
+
+            if trocas:
+                # alterna os pares (0,1),(2,3)... e (1,2),(3,4)... entre as rodadas
+                ordem = sorted(range(num_cadeias), key=lambda c: temperaturas[c])
+                for k in range(rodada % 2, num_cadeias - 1, 2):
+                    i, j = ordem[k], ordem[k + 1]
+                    expoente = (1 / temperaturas[i] - 1 / temperaturas[j]) * (custos[i] - custos[j])
+                    if expoente >= 0 or random.random() < math.exp(expoente):
+                        estados[i], estados[j] = estados[j], estados[i]
+                        custos[i], custos[j] = custos[j], custos[i]
+                        PERFIL.contar("trocas_tempering")
+
+    return melhor, custo_melhor
@@ -0,0 +1,46 @@
+import time
+from simulated_annealing import *
+from comum.perfil import PERFIL
+from comum.tsp import gerar_cidades_aleatorias, matriz_distancias
+
+if __name__ == "__main__":
+    with PERFIL.sessao("perfil_simulated_annealing"):
+        # Caso de teste 1
+        # Mochila com capacidade 10, 5 itens com pesos e valores diferentes
+        # Resultado esperado: 23, escolhendo [1, 1, 0, 1, 0]
+        mochila = Mochila([2, 3, 4, 5, 6], [5, 8, 9, 10, 12], 10)
+        melhor, custo = simulated_annealing(mochila, 20000)
+        print(f"\nMochila 1: {melhor, -custo} (Esperado: {[1, 1, 0, 1, 0], 23})\n")
+
+        # Caso de teste 2
+        # Mochila com capacidade 20, 6 itens com pesos e valores diferentes, resfriamento adaptativo
+        # Resultado esperado: 31, escolhendo [1, 1, 1, 0, 1, 0]
+        mochila = Mochila([2, 3, 5, 7, 9, 11], [6, 7, 8, 9, 10, 12], 20)
+        melhor, custo = simulated_annealing(mochila, 20000, ResfriamentoAdaptativo(passos=200))
+        print(f"\nMochila 2: {melhor, -custo} (Esperado: {[1, 1, 1, 0, 1, 0], 31})\n")
+
+        # Caso de teste 3
+        # Caixeiro viajante com 8 cidades nos vértices de um octógono, resfriamento com reaquecimento
+        # Resultado esperado: a rota que percorre o contorno, de comprimento 8 * lado
+        angulos = np.arange(8) * 2 * np.pi / 8
+        coordenadas = np.stack([np.cos(angulos), np.sin(angulos)], axis=1) * 100
+        dist = matriz_distancias(coordenadas, "REAL")
+        caixeiro = CaixeiroViajante(dist, num_candidatos=7)
+        melhor, custo = simulated_annealing(caixeiro, 50000, ResfriamentoReaquecimento(passos=200))
+        print(f"\nCaixeiro 1: {melhor, round(custo, 2)} (Esperado: {round(8 * dist[0, 1], 2)})\n")
+
+        # Caso de teste 4
+        # Caixeiro viajante com 1000 cidades aleatórias: velocidade em uma cadeia e parallel tempering
+        dist = matriz_distancias(gerar_cidades_aleatorias(1000))
+        caixeiro = CaixeiroViajante(dist)
+        custo_inicial = caixeiro.custo
+        inicio = time.time()
+        melhor, custo = simulated_annealing(caixeiro, 1000000, ResfriamentoGeometrico(0.98, 10000))
+        duracao = time.time() - inicio
+        print(f"\nCaixeiro 2: {custo_inicial:.0f} -> {custo:.0f} ({1000000 / duracao * 60:.0f} movimentos/min)\n")
+
+        caixeiro.restaurar(melhor)
+        temperaturas = [estimar_temperatura_inicial(caixeiro, taxa) for taxa in (0.05, 0.1, 0.2, 0.4)]
+        melhor, custo = cadeias_paralelas(caixeiro, temperaturas, [ResfriamentoGeometrico(0.99, 10000) for _ in temperaturas],
+                                          num_passos=100000, num_rodadas=5, trocas=True)
+        print(f"\nCaixeiro 2 (parallel tempering): {custo:.0f}\n")